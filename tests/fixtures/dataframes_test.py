@@ -25,19 +25,19 @@ CUSTOM_DF = DataFrame({
 
 @pytest.fixture
 def client() -> DataFrame:
-    return CLIENT_DF
+    return CLIENT_DF.copy()
 
 
 @pytest.fixture
 def client_modified() -> DataFrame:
-    return CLIENT_MODIFIED_DF
+    return CLIENT_MODIFIED_DF.copy()
 
 
 @pytest.fixture
 def client_test() -> DataFrame:
-    return CLIENT_TEST_DF
+    return CLIENT_TEST_DF.copy()
 
 
 @pytest.fixture
 def custom() -> DataFrame:
-    return CUSTOM_DF
\ No newline at end of file
+    return CUSTOM_DF.copy()
\ No newline at end of file
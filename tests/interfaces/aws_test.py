@@ -0,0 +1,41 @@
+from dataclasses import replace
+
+import pytest
+
+from verbosa.interfaces.aws import AthenaDataBaseDetails
+
+
+def test_athena_details_interned_and_hashable() -> None:
+    ctas = {"bucketing_info": (["id"], 4)}
+    details = AthenaDataBaseDetails(
+        database="db_interned", ctas_parameters=ctas
+    )
+    again = AthenaDataBaseDetails(
+        database="db_interned", ctas_parameters={"bucketing_info": (["id"], 4)}
+    )
+    
+    assert details is again
+    assert hash(details) == hash(again)
+    assert {details: 1}[again] == 1
+    assert details != AthenaDataBaseDetails(database="db_interned")
+
+
+def test_athena_details_keep_their_own_parameters() -> None:
+    unload = {"file_format": "PARQUET", "partitioned_by": ["year"]}
+    details = AthenaDataBaseDetails(
+        database="db_copied", unload_parameters=unload
+    )
+    
+    # Changes to the caller's mapping do not reach the shared instance
+    unload["file_format"] = "ORC"
+    unload["partitioned_by"].append("month")
+    
+    assert details.unload_parameters["file_format"] == "PARQUET"
+    assert details.unload_parameters["partitioned_by"] == ["year"]
+    with pytest.raises(TypeError):
+        details.unload_parameters["file_format"] = "ORC"
+    
+    # Copies with other values are built from the frozen parameters
+    unloaded = replace(details, unload_approach=True)
+    assert unloaded.unload_parameters == details.unload_parameters
+    assert unloaded.unload_approach
\ No newline at end of file
@@ -325,6 +325,40 @@ def test_frozen_dataclass_behavior() -> None:
     assert isinstance(hash_val, int)
 
 
+def test_call_spec_cached_hashes() -> None:
+    """
+    Test that the cached hashes of CallSpec stay consistent, also after a
+    pickle round trip.
+    """
+    import pickle
+    spec = CallSpec.from_map("text", {"case": "title", "strip": "both"})
+    
+    assert hash(spec) == hash(spec) == hash((spec.method_name, spec.params))
+    assert spec.to_hash() is spec.to_hash()
+    
+    restored = pickle.loads(pickle.dumps(spec))
+    assert restored == spec
+    assert hash(restored) == hash(spec)
+    assert restored.to_hash() == spec.to_hash()
+
+
+def test_call_spec_dataclass_helpers() -> None:
+    """
+    Test that the cached hashes are not part of the dataclass fields.
+    """
+    import dataclasses
+    spec = CallSpec.from_map("text", {"case": "title"})
+    hash(spec)
+    spec.to_hash()
+    
+    names = tuple(f.name for f in dataclasses.fields(spec))
+    assert names == ("method_name", "params")
+    assert dataclasses.asdict(spec) == {
+        "method_name": "text", "params": (("case", "title"),)
+    }
+    assert dataclasses.astuple(spec) == ("text", (("case", "title"),))
+
+
 def test_pipeline_conversion_edge_cases() -> None:
     """
     Test edge cases in pipeline conversion.
@@ -409,6 +443,15 @@ def test_error_handling_in_parse_pipeline() -> None:
             dtype="string",
             normalization=123  # Invalid type
         )
+    
+    # Test a tuple mixing specs with other values
+    spec = CallSpec.from_map("text", None)
+    with pytest.raises(TypeError):
+        ColumnConfig(
+            name="test",
+            dtype="string",
+            normalization=(spec, "oops")
+        )
 
 
 def test_round_trip_serialization() -> None:
@@ -2,7 +2,7 @@ import pytest
 
 from tests.utils.config import CONFIG_EXAMPLES_DIRECTORY
 from verbosa.interfaces.columns_config import ColumnsConfig
-from verbosa.interfaces.column_config import CallSpec
+from verbosa.interfaces.column_config import CallSpec, ColumnConfig
 
 
 @pytest.fixture
@@ -134,4 +134,45 @@ def test_group_by_normalization(path: str) -> None:
     for callspec, columns in groups:
         assert isinstance(callspec, CallSpec)
         assert isinstance(columns, tuple)
-        assert all(isinstance(col_name, str) for col_name in columns)
\ No newline at end of file
+        assert all(isinstance(col_name, str) for col_name in columns)
+
+
+def test_from_yaml_instances_are_independent(path: str) -> None:
+    config: ColumnsConfig = ColumnsConfig.from_yaml(path)
+    config["fecha"].na_values = ("X",)
+    
+    reloaded: ColumnsConfig = ColumnsConfig.from_yaml(path)
+    
+    assert reloaded is not config
+    assert reloaded["fecha"].na_values != ("X",)
+
+
+def test_na_dicts_follow_column_changes(path: str) -> None:
+    config: ColumnsConfig = ColumnsConfig.from_yaml(path)
+    config.get_na_values_dict()
+    config.get_columns_fill_na_dict()
+    
+    config["fecha"].na_values = ("X",)
+    config["fecha"].fill_na = "2000-01-01"
+    
+    assert config.get_na_values_dict()["fecha"] == ("X",)
+    assert config.get_columns_fill_na_dict()["fecha"] == "2000-01-01"
+
+
+def test_validate_aliases_exact_duplicates() -> None:
+    config = ColumnsConfig(
+        name="test",
+        description="",
+        author="",
+        date="",
+        columns=[
+            ColumnConfig(name="a", dtype="string"),
+            ColumnConfig(name="a", dtype="string"),
+            ColumnConfig(name="A", dtype="string"),
+        ]
+    )
+    
+    issues = config.validate_aliases()
+    
+    assert "Duplicate column names (case-sensitive): a" in issues
+    assert not config.is_valid()
\ No newline at end of file
@@ -75,6 +75,21 @@ def test_numeric_normalization(custom: pd.DataFrame) -> None:
     )
 
 
+def test_numeric_normalization_raise(custom: pd.DataFrame) -> None:
+    custom["clean_numbers"] = ["1", "2", None, "4", "5"]
+    normalizer = TabularDataNormalizer(data=custom)
+    normalizer.numeric(["clean_numbers"], errors="raise", dtype="Int64")
+    
+    expected_numbers = pd.Series(
+        [1, 2, pd.NA, 4, 5], name="clean_numbers"
+    ).astype("Int64")
+    
+    assert_series_equal(
+        normalizer.data["clean_numbers"],
+        expected_numbers
+    )
+
+
 # --------------------- Categorical normalization tests -------------------- #
 def test_categorical_fill_na(client: pd.DataFrame) -> None:
     normalizer = TabularDataNormalizer(data=client)
@@ -143,4 +158,26 @@ def test_categorical_convert_na(client: pd.DataFrame) -> None:
 def test_autonorm(client: pd.DataFrame) -> None:
     config_path = "./tests/assets/examples/configs/column_norm_config.yaml"
     normalizer = TabularDataNormalizer(client, config_path=config_path)
-    normalizer.autonorm()
\ No newline at end of file
+    normalizer.autonorm()
+
+
+def test_autonorm_skips_missing_columns(client: pd.DataFrame) -> None:
+    config_path = "./tests/assets/examples/configs/column_norm_config.yaml"
+    data = client.drop(columns=["monto", "tipo"])
+    normalizer = TabularDataNormalizer(data, config_path=config_path)
+    normalized_data = normalizer.autonorm()
+    
+    assert "monto" not in normalized_data.columns
+    assert "tipo" not in normalized_data.columns
+    assert str(normalized_data["saldo"].dtype) == "Float64"
+
+
+def test_autonorm_renames_aliases(client: pd.DataFrame) -> None:
+    config_path = "./tests/assets/examples/configs/column_norm_config.yaml"
+    data = client.rename(columns={"fecha": "date", "monto": "amount"})
+    normalizer = TabularDataNormalizer(data, config_path=config_path)
+    normalized_data = normalizer.autonorm()
+    
+    assert list(normalized_data.columns[:3]) == ["fecha", "concepto", "monto"]
+    assert "date" not in normalized_data.columns
+    assert str(normalized_data["monto"].dtype) == "Float64"
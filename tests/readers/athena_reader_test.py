@@ -1,9 +1,44 @@
+from pathlib import Path
+from typing import Any, Optional
+import os
+import time
+
+from awswrangler import _sql_formatter
+from pandas.testing import assert_frame_equal
+import awswrangler as wr
 import pandas as pd
+import pytest
 
 
 from tests.fixtures.secrets_test import aws_credentials, aws_db_details, aws_secrets
 from tests.fixtures.queries_test import basic_table_query
 from verbosa.data.readers.aws import AthenaDataReader
+from verbosa.interfaces.aws import AthenaDataBaseDetails
+
+
+@pytest.fixture
+def offline_reader() -> AthenaDataReader:
+    # Never reaches AWS, the awswrangler calls are monkeypatched per test
+    return AthenaDataReader(
+        boto3_session=None,
+        db_details=AthenaDataBaseDetails(database="test_db")
+    )
+
+
+@pytest.fixture
+def rendered_queries(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    # SQL of every read_sql_query call, with its parameters rendered the
+    # way awswrangler does before sending the query to Athena
+    rendered: list[str] = []
+    
+    def read_sql_query(
+        sql: str, params: Optional[dict[str, Any]] = None, **kwargs: Any
+    ) -> pd.DataFrame:
+        rendered.append(_sql_formatter._process_sql_params(sql, params))
+        return pd.DataFrame({"a": [1]})
+    
+    monkeypatch.setattr(wr.athena, "read_sql_query", read_sql_query)
+    return rendered
 
 
 def test_optimization_method(aws_credentials, aws_db_details):
@@ -18,6 +53,39 @@ def test_optimization_method(aws_credentials, aws_db_details):
     assert not reader.db_details.unload_approach
 
 
+def test_optimize_for_large_unloads_to_parquet(
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    forwarded: list[dict[str, Any]] = []
+    
+    def read_sql_query(sql: str, **kwargs: Any) -> pd.DataFrame:
+        forwarded.append(kwargs)
+        return pd.DataFrame({"a": [1]})
+    
+    monkeypatch.setattr(wr.athena, "read_sql_query", read_sql_query)
+    reader = AthenaDataReader(
+        boto3_session=None,
+        db_details=AthenaDataBaseDetails(
+            database="test_db", ctas_approach=True
+        )
+    )
+    
+    reader.optimize_for(output_size="large")
+    reader.execute_query("SELECT 1;")
+    reader.optimize_for(output_size="small")
+    reader.execute_query("SELECT 1;")
+    
+    large, small = forwarded
+    assert large["unload_approach"] is True
+    assert large["ctas_approach"] is False
+    assert large["unload_parameters"] == {
+        "file_format": "PARQUET", "compression": "snappy"
+    }
+    assert small["unload_approach"] is False
+    assert small["ctas_approach"] is False
+    assert small["unload_parameters"] is None
+
+
 def test_queries_via_template(
     basic_table_query,
     aws_credentials,
@@ -37,4 +105,216 @@ def test_queries_via_template(
         table_name=aws_secrets["table"]
     )
     
-    assert isinstance(output, pd.DataFrame)
\ No newline at end of file
+    assert isinstance(output, pd.DataFrame)
+
+
+def test_simple_query_renders_sql(
+    offline_reader: AthenaDataReader,
+    rendered_queries: list[str]
+) -> None:
+    offline_reader.simple_query("clients", "*")
+    offline_reader.simple_query(
+        "clients", ["name", "rfc"], filter_by="name", value="O'Brien"
+    )
+    offline_reader.simple_query("clients", ("a",), filter_by="b", value=5)
+    
+    assert rendered_queries == [
+        "SELECT * FROM test_db.clients;",
+        "SELECT name, rfc FROM test_db.clients WHERE name = 'O''Brien';",
+        "SELECT a FROM test_db.clients WHERE b = 5;",
+    ]
+
+
+def test_simple_query_binds_quoted_values_literally(
+    offline_reader: AthenaDataReader,
+    rendered_queries: list[str]
+) -> None:
+    # Pre-quoted values are not pasted as SQL anymore, their quotes become
+    # part of the compared string
+    offline_reader.simple_query("t", "a", filter_by="b", value="'abc'")
+    
+    assert rendered_queries == [
+        "SELECT a FROM test_db.t WHERE b = '''abc''';"
+    ]
+    assert rendered_queries[0].count(";") == 1
+
+
+# ------------------------ Result caching (offline) ------------------------ #
+@pytest.fixture
+def query_calls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, Any]]:
+    # (sql, params) of every query sent, each result tells its call number
+    calls: list[tuple[str, Any]] = []
+    
+    def read_sql_query(
+        sql: str, params: Optional[dict[str, Any]] = None, **kwargs: Any
+    ) -> pd.DataFrame:
+        calls.append((sql, params))
+        return pd.DataFrame({"call": [len(calls)]})
+    
+    monkeypatch.setattr(wr.athena, "read_sql_query", read_sql_query)
+    return calls
+
+
+def test_cache_hit_skips_query(
+    tmp_path: Path,
+    query_calls: list[tuple[str, Any]]
+) -> None:
+    reader = AthenaDataReader(
+        boto3_session=None,
+        db_details=AthenaDataBaseDetails(database="test_db"),
+        cache_dir=tmp_path
+    )
+    
+    first = reader.execute_query("SELECT 1;")
+    second = reader.execute_query("SELECT 1;")
+    
+    assert len(query_calls) == 1
+    assert_frame_equal(first, second)
+    
+    reader.clear_cache()
+    reader.execute_query("SELECT 1;")
+    assert len(query_calls) == 2
+
+
+def test_cache_expired_ttl_reruns_query(
+    tmp_path: Path,
+    query_calls: list[tuple[str, Any]]
+) -> None:
+    reader = AthenaDataReader(
+        boto3_session=None,
+        db_details=AthenaDataBaseDetails(database="test_db"),
+        cache_dir=tmp_path,
+        cache_ttl=60
+    )
+    
+    reader.execute_query("SELECT 1;")
+    reader.execute_query("SELECT 1;")
+    assert len(query_calls) == 1
+    
+    # Age the cached result past the TTL
+    (cache_file,) = tmp_path.glob("*.parquet")
+    past = time.time() - 120
+    os.utime(cache_file, (past, past))
+    
+    result = reader.execute_query("SELECT 1;")
+    assert len(query_calls) == 2
+    assert result["call"].tolist() == [2]
+
+
+def test_cache_key_includes_params(
+    tmp_path: Path,
+    query_calls: list[tuple[str, Any]]
+) -> None:
+    reader = AthenaDataReader(
+        boto3_session=None,
+        db_details=AthenaDataBaseDetails(database="test_db"),
+        cache_dir=tmp_path
+    )
+    query = "SELECT * FROM t WHERE a = :value;"
+    
+    one = reader.execute_query(query, params={"value": 1})
+    two = reader.execute_query(query, params={"value": 2})
+    again = reader.execute_query(query, params={"value": 1})
+    
+    assert query_calls == [(query, {"value": 1}), (query, {"value": 2})]
+    assert one["call"].tolist() == again["call"].tolist() == [1]
+    assert two["call"].tolist() == [2]
+
+
+def test_corrupt_cache_entry_reruns_query(
+    tmp_path: Path,
+    query_calls: list[tuple[str, Any]]
+) -> None:
+    reader = AthenaDataReader(
+        boto3_session=None,
+        db_details=AthenaDataBaseDetails(database="test_db"),
+        cache_dir=tmp_path
+    )
+    reader.execute_query("SELECT 1;")
+    
+    # Truncate the cached result, as an interrupted write would leave it
+    (cache_file,) = tmp_path.glob("*.parquet")
+    cache_file.write_bytes(cache_file.read_bytes()[:20])
+    
+    result = reader.execute_query("SELECT 1;")
+    
+    assert len(query_calls) == 2
+    assert result["call"].tolist() == [2]
+    
+    # The entry was replaced by the new result
+    assert_frame_equal(reader.execute_query("SELECT 1;"), result)
+    assert len(query_calls) == 2
+
+
+def test_execute_queries_keeps_input_order(
+    offline_reader: AthenaDataReader,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Each result names its query, "FAIL" can not be submitted and
+    # "BROKEN" fails while running
+    submitted: list[str] = []
+    
+    def start_query_execution(sql: str, **kwargs: Any) -> str:
+        if sql == "FAIL":
+            raise RuntimeError("invalid query")
+        submitted.append(sql)
+        return f"id-{sql}"
+    
+    def get_query_results(query_execution_id: str, **kwargs: Any):
+        if query_execution_id == "id-BROKEN":
+            raise RuntimeError("query failed")
+        return pd.DataFrame({"query": [query_execution_id[3:]]})
+    
+    monkeypatch.setattr(
+        wr.athena, "start_query_execution", start_query_execution
+    )
+    monkeypatch.setattr(wr.athena, "get_query_results", get_query_results)
+    
+    results = offline_reader.execute_queries(
+        ["SELECT 3", "FAIL", "SELECT 1", "BROKEN", "SELECT 2"]
+    )
+    
+    assert submitted == ["SELECT 3", "SELECT 1", "BROKEN", "SELECT 2"]
+    assert results[1] is None
+    assert results[3] is None
+    assert [df["query"].item() for df in results if df is not None] == [
+        "SELECT 3", "SELECT 1", "SELECT 2"
+    ]
+
+
+def test_execute_queries_placeholder_and_unreadable_files(
+    offline_reader: AthenaDataReader,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path
+) -> None:
+    # Placeholders are not filled, the query is sent as written
+    template_file = tmp_path / "template.sql"
+    template_file.write_text("SELECT ${columns} FROM t;", encoding="utf-8")
+    broken_file = tmp_path / "broken.sql"
+    broken_file.write_bytes(b"SELECT \xff;")
+    
+    submitted: list[str] = []
+    
+    def start_query_execution(sql: str, **kwargs: Any) -> str:
+        submitted.append(sql)
+        return sql
+    
+    def get_query_results(query_execution_id: str, **kwargs: Any):
+        if "${" in query_execution_id:
+            raise RuntimeError("syntax error")
+        return pd.DataFrame({"query": [query_execution_id]})
+    
+    monkeypatch.setattr(
+        wr.athena, "start_query_execution", start_query_execution
+    )
+    monkeypatch.setattr(wr.athena, "get_query_results", get_query_results)
+    
+    results = offline_reader.execute_queries(
+        ["SELECT 1", template_file, broken_file, "SELECT 2"]
+    )
+    
+    assert submitted == ["SELECT 1", "SELECT ${columns} FROM t;", "SELECT 2"]
+    assert results[1] is None
+    assert results[2] is None
+    assert results[0]["query"].item() == "SELECT 1"
+    assert results[3]["query"].item() == "SELECT 2"
\ No newline at end of file
@@ -0,0 +1,141 @@
+from pathlib import Path
+from typing import Any
+import errno
+import os
+import shutil
+
+import pytest
+
+from verbosa.data.readers.local import FileDataReader, FileSystemNavigator
+
+
+@pytest.fixture
+def linked_directory(tmp_path: Path) -> Path:
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "file.txt").write_text("content", encoding="utf-8")
+    
+    link = tmp_path / "link"
+    link.symlink_to(target, target_is_directory=True)
+    return tmp_path
+
+
+@pytest.mark.parametrize("relative", [True, False])
+def test_rm_removes_symlink_not_target(
+    linked_directory: Path,
+    relative: bool
+) -> None:
+    navigator = FileSystemNavigator(linked_directory)
+    link = linked_directory / "link"
+    
+    navigator.rm("link" if relative else link, confirm=True)
+    
+    assert not os.path.lexists(link)
+    assert (linked_directory / "target" / "file.txt").is_file()
+
+
+def test_rm_relative_to_working_directory(
+    linked_directory: Path,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(linked_directory)
+    navigator = FileSystemNavigator(".")
+    
+    navigator.rm("link", confirm=True)
+    
+    assert not os.path.lexists(linked_directory / "link")
+    assert (linked_directory / "target" / "file.txt").is_file()
+
+
+def test_rm_without_confirm_keeps_target(linked_directory: Path) -> None:
+    navigator = FileSystemNavigator(linked_directory)
+    
+    navigator.rm("target")
+    
+    assert (linked_directory / "target").is_dir()
+
+
+def test_read_file_unsupported_type(tmp_path: Path) -> None:
+    book = tmp_path / "book.xlsx"
+    book.write_bytes(b"")
+    
+    with pytest.raises(ValueError, match="Unsupported file type"):
+        FileDataReader.read_file(book)
+
+
+# ------------------------------- mv tests -------------------------------- #
+@pytest.fixture
+def navigator(tmp_path: Path) -> FileSystemNavigator:
+    (tmp_path / "file.txt").write_text("content", encoding="utf-8")
+    (tmp_path / "folder").mkdir()
+    return FileSystemNavigator(tmp_path)
+
+
+def test_mv_renames_and_moves_into_directories(
+    navigator: FileSystemNavigator
+) -> None:
+    wd = navigator.pwd()
+    
+    navigator.mv("file.txt", "renamed.txt")
+    assert (wd / "renamed.txt").read_text(encoding="utf-8") == "content"
+    
+    navigator.mv("renamed.txt", "folder")
+    assert (wd / "folder" / "renamed.txt").is_file()
+    assert not (wd / "renamed.txt").exists()
+
+
+@pytest.mark.parametrize("non_empty", [False, True])
+def test_mv_keeps_existing_destination(
+    navigator: FileSystemNavigator,
+    non_empty: bool
+) -> None:
+    wd = navigator.pwd()
+    (wd / "source").mkdir()
+    (wd / "source" / "inner.txt").write_text("new", encoding="utf-8")
+    (wd / "folder" / "source").mkdir()
+    if non_empty:
+        (wd / "folder" / "source" / "old.txt").write_text(
+            "old", encoding="utf-8"
+        )
+    
+    with pytest.raises(shutil.Error, match="already exists"):
+        navigator.mv("source", "folder")
+    
+    assert (wd / "source" / "inner.txt").is_file()
+    assert not (wd / "folder" / "source" / "inner.txt").exists()
+
+
+def test_mv_falls_back_to_copy_across_filesystems(
+    navigator: FileSystemNavigator,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Every rename fails as it does between filesystems
+    def rename(src: Any, dst: Any) -> None:
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+    
+    monkeypatch.setattr(os, "rename", rename)
+    wd = navigator.pwd()
+    
+    navigator.mv("file.txt", "folder")
+    
+    moved = wd / "folder" / "file.txt"
+    assert moved.read_text(encoding="utf-8") == "content"
+    assert not (wd / "file.txt").exists()
+
+
+def test_mv_missing_source(navigator: FileSystemNavigator) -> None:
+    (navigator.pwd() / "folder" / "missing.txt").mkdir()
+    
+    with pytest.raises(FileNotFoundError, match="Source path does not exist"):
+        navigator.mv("missing.txt", "other.txt")
+    with pytest.raises(FileNotFoundError, match="Source path does not exist"):
+        navigator.mv("missing.txt", "folder")
+
+
+def test_mv_missing_destination_parent(navigator: FileSystemNavigator) -> None:
+    wd = navigator.pwd()
+    
+    with pytest.raises(FileNotFoundError):
+        navigator.mv("file.txt", "nowhere/file.txt")
+    
+    assert (wd / "file.txt").is_file()
\ No newline at end of file
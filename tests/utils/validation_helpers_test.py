@@ -0,0 +1,18 @@
+from verbosa.utils.validation_helpers import is_file_path
+from tests.utils.config import QUERIES_EXAMPLES_DIRECTORY
+
+
+def test_is_file_path_for_files() -> None:
+    query_file = next(QUERIES_EXAMPLES_DIRECTORY.glob("*.sql"))
+    
+    assert is_file_path(query_file)
+    assert is_file_path(str(query_file), extension="sql")
+    assert is_file_path(str(query_file), extension=".sql")
+    assert not is_file_path(str(query_file), extension="txt")
+
+
+def test_is_file_path_for_inline_sql() -> None:
+    assert not is_file_path("SELECT 1;")
+    assert not is_file_path("SELECT a\nFROM b;")
+    assert not is_file_path("SELECT " + ", ".join(["column"] * 100) + ";")
+    assert not is_file_path("null\x00byte")
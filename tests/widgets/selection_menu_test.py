@@ -1,4 +1,7 @@
+from pandas.testing import assert_frame_equal, assert_series_equal
+import numpy as np
 import pandas as pd
+import pytest
 
 from tests.fixtures.dataframes_test import client
 from verbosa.widgets.selection_menu import SelectionMenu
@@ -18,4 +21,76 @@ def test_selection_menu_search(client: pd.DataFrame) -> None:
     )
     
     # Send result to a file at the output folder
-    search_results.to_csv("./output/selection_menu_test.csv", index=True)
\ No newline at end of file
+    search_results.to_csv("./output/selection_menu_test.csv", index=True)
+
+
+@pytest.fixture
+def menu() -> SelectionMenu:
+    data = pd.DataFrame({
+        "concepto": ["Pago SPEI", "Compra", None, "spei recibido"],
+        "monto": [72, 172, 5, 7],
+        "saldo": [1.5, np.nan, 72.0, 3.0],
+        "tipo": pd.Categorical(["abono", "cargo", None, "Abono"]),
+    })
+    return SelectionMenu(data=data)
+
+
+def test_search_substring(menu: SelectionMenu) -> None:
+    results = menu.search("spei", at="concepto")
+    assert results.index.tolist() == [0, 3]
+    
+    results = menu.search("spei", at="concepto", case_sensitive=True)
+    assert results.index.tolist() == [3]
+    
+    # Non string values are casted, the search spans every column
+    assert menu.search(72).index.tolist() == [0, 1, 2]
+
+
+def test_search_whole_match_case_insensitive(menu: SelectionMenu) -> None:
+    results = menu.search("PAGO SPEI", at="concepto", whole_match=True)
+    assert results.index.tolist() == [0]
+    
+    results = menu.search("pago", at="concepto", whole_match=True)
+    assert results.empty
+    
+    results = menu.search(
+        "PAGO SPEI", at="concepto", case_sensitive=True, whole_match=True
+    )
+    assert results.empty
+
+
+def test_search_na_cells_never_match(menu: SelectionMenu) -> None:
+    for value in ("<NA>", "nan", "None"):
+        assert menu.search(value).empty
+        assert menu.search(value, whole_match=True).empty
+    
+    # Every non missing cell contains the empty string
+    assert menu.search("", at="concepto").index.tolist() == [0, 1, 3]
+
+
+def test_search_categorical_columns(menu: SelectionMenu) -> None:
+    assert menu.search("abono", at="tipo").index.tolist() == [0, 3]
+    assert menu.search("bo", at="tipo").index.tolist() == [0, 3]
+    
+    results = menu.search("Abono", at="tipo", case_sensitive=True)
+    assert results.index.tolist() == [3]
+    
+    results = menu.search("CARGO", at="tipo", whole_match=True)
+    assert results.index.tolist() == [1]
+
+
+def test_search_keeps_dtypes(menu: SelectionMenu) -> None:
+    dtypes = menu.data.dtypes
+    results = menu.search("spei")
+    
+    assert_series_equal(results.dtypes, dtypes)
+    assert_series_equal(menu.data.dtypes, dtypes)
+    assert_frame_equal(results, menu.data.iloc[[0, 3]])
+
+
+def test_search_follows_in_place_edits(menu: SelectionMenu) -> None:
+    assert menu.search(72, at="monto").index.tolist() == [0, 1]
+    
+    menu.data["monto"] = [72] * 4
+    
+    assert menu.search(72, at="monto").index.tolist() == [0, 1, 2, 3]
\ No newline at end of file
@@ -93,9 +93,9 @@ class TabularDataComparator:
         self._validate_diff_columns(df, df_name=name)
         self._validate_visual_column(df, df_name=name)
         
-        return (
-            df.sort_values(by=self.sort_columns, kind="mergesort")
-            .reset_index(drop=True)
+        # A fresh RangeIndex as part of the sort, no reset_index pass
+        return df.sort_values(
+            by=self.sort_columns, kind="mergesort", ignore_index=True
         )
     
     def _suffix(self, col: str, label: str) -> str:
@@ -1,12 +1,16 @@
 # Python standard library imports
 from __future__ import annotations
 from pathlib import Path
-from typing import Any, Callable, Literal, Optional, Sequence, TypeAlias
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any, Callable, Literal, Mapping, Optional, Sequence, TypeAlias
+)
 import logging
 import re
 
 # Third-party imports
-from pandas.api.types import is_datetime64_any_dtype
+from pandas.api.types import infer_dtype, is_datetime64_any_dtype
 import pandas as pd
 
 # Library imports
@@ -54,7 +58,25 @@ CastingErrorHandling: TypeAlias = Literal["raise", "ignore", "coerce"]
 ##############################################################################
 
 _RE_COMBINING_MARKS: re.Pattern = re.compile(r"[\u0300-\u036f]+")
+_RE_MULTI_WHITESPACE: re.Pattern = re.compile(r"\s{2,}")
 _RE_NON_ASCII: re.Pattern = re.compile(r"[^\x00-\x7F]+")
+_RE_NUMERIC_CLEANUP: re.Pattern = re.compile(r"[$\s,%]+")
+
+
+
+##############################################################################
+#                              HELPER FUNCTIONS                              #
+##############################################################################
+
+@lru_cache(maxsize=128)
+def _compile_cleanup(
+    pattern: Optional[str | re.Pattern]
+) -> Optional[re.Pattern]:
+    """
+    Compile a user provided cleanup pattern, memoized across calls so
+    pipelines reusing the same pattern compile it only once.
+    """
+    return re.compile(pattern) if pattern is not None else None
 
 
 
@@ -100,6 +122,38 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
         .union(BOOLEAN_DTYPES)
     )
     
+    # Rows inspected to decide if a column repeats enough to normalize its
+    # distinct values only
+    _DISTINCT_SAMPLE_SIZE: int = 1_000
+    
+    # Coercion applied to NA fill values, keyed by normalized dtype
+    _FILL_VALUE_COERCERS: Mapping[str, Callable[[Any], Any]] = (
+        MappingProxyType({
+            **dict.fromkeys(STRING_DTYPES, str),
+            **dict.fromkeys(NUMERIC_DTYPES, float),
+        })
+    )
+    
+    # Preset parametrizations for the specific normalization methods
+    _TEXT_STRESSED_PARAMS: Mapping[str, Any] = MappingProxyType({
+        "strip": "both",
+        "compact_whitespace": " ",
+        "case": "upper",
+        "empty_to_na": True,
+        "delete_diacritics": True,
+        "delete_non_ascii": True
+    })
+    _TEXT_RELAXED_PARAMS: Mapping[str, Any] = MappingProxyType({
+        "strip": "both",
+        "compact_whitespace": " ",
+        "empty_to_na": True
+    })
+    _CATEGORICAL_RELAXED_PARAMS: Mapping[str, Any] = MappingProxyType({
+        **_TEXT_STRESSED_PARAMS,
+        "ordered": False,
+        "sort_categories": True
+    })
+    
     data: pd.DataFrame
     
     def __init__(
@@ -171,15 +225,62 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
             "Beggining column sorting as in the configuration provided."
         )
         
+        # 1) Rename columns referenced by an alias to their configured name
+        data_columns = set(self.data.columns)
+        rename_map: dict[str, str] = {}
+        for col in self.data.columns:
+            if col not in self.autonorm_settings:
+                continue
+            
+            name = self.autonorm_settings[col].name
+            if name == col:
+                continue
+            if name in data_columns:
+                logger.warning(
+                    f"Column '{col}' is an alias of '{name}', which is "
+                    f"already present in the data. Keeping its label."
+                )
+                continue
+            
+            rename_map[col] = name
+            data_columns.add(name)
+        
+        if rename_map:
+            self.data = self.data.rename(columns=rename_map, copy=False)
+            data_columns = set(self.data.columns)
+            logger.debug(
+                f"Renamed columns to their configured names: {rename_map}"
+            )
+        
+        # 2) Build the configuration order, unknown columns go last
+        in_config = [
+            col for col in self.autonorm_settings
+            if col in data_columns
+        ]
+        not_in_data = [
+            col for col in self.autonorm_settings
+            if col not in data_columns
+        ]
+        in_config_set = set(in_config)
         not_in_config = [
             col for col in self.data.columns
-            if col not in self.autonorm_settings
+            if col not in in_config_set
         ]
-        new_order = list(self.autonorm_settings) + list(not_in_config)
+        new_order = in_config + not_in_config
+        
+        if not_in_data:
+            logger.warning(
+                f"Columns {not_in_data} defined in the configuration were "
+                f"not found in the data. They will be skipped."
+            )
+        
+        # 3) Skip the block reshuffle when the data is already sorted
+        if list(self.data.columns) == new_order:
+            logger.info("Columns already sorted as in the configuration.")
+            return None
         
-        # Sort columns into the provided config order. This action will also
-        # rename each column name to each ColumnConfig.name attribute.
-        self.data = self.data.loc[:, new_order]
+        # 4) Sort columns into the provided config order
+        self.data = self.data.reindex(columns=new_order, copy=False)
         
         logger.info(
             "Ended column sorting according to configuration."
@@ -188,7 +289,13 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
     def _convert_na_values(self) -> None:
         logger.info("Beginning conversion of defined NA values to pd.NA.")
         
-        na_values_dict = self.autonorm_settings.get_na_values_dict()
+        data_columns = set(self.data.columns)
+        na_values_dict = {
+            column: na_values
+            for column, na_values
+            in self.autonorm_settings.get_na_values_dict().items()
+            if column in data_columns
+        }
         self.convert_to_na(columns_and_nas=na_values_dict)
         
         logger.info("Ended conversion of defined NA values to pd.NA.")
@@ -198,9 +305,14 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
             "Beginning application of normalization methods to column groups."
         )
         
+        data_columns = set(self.data.columns)
         norm_groups = self.autonorm_settings.group_by_normalization()
         for spec, columns in norm_groups:
             method_name = spec.method_name
+            columns = tuple(col for col in columns if col in data_columns)
+            if not columns:
+                continue
+            
             if not hasattr(self, method_name):
                 logger.warning(
                     f"Normalization method '{method_name}' not found in "
@@ -224,11 +336,160 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
     def _fill_na_values(self) -> None:
         logger.info("Filling defined NA values in columns.")
         
-        fill_values_dict = self.autonorm_settings.get_columns_fill_na_dict()
+        data_columns = set(self.data.columns)
+        fill_values_dict = {
+            column: fill_value
+            for column, fill_value
+            in self.autonorm_settings.get_columns_fill_na_dict().items()
+            if column in data_columns
+        }
         self.fill_na(columns_and_fills=fill_values_dict)
         
         logger.info("Completed filling defined NA values in columns.")
     
+    def _text_series(
+        self,
+        s: pd.Series,
+        *,
+        error: CastingErrorHandling,
+        strip: Optional[Literal["both", "left", "right"]],
+        compact_whitespace: Optional[Any],
+        case: Optional[Literal["lower", "upper", "title"]],
+        empty_to_na: bool,
+        delete_diacritics: bool,
+        delete_non_ascii: bool,
+        cleanup_re: Optional[re.Pattern]
+    ) -> pd.Series:
+        """
+        Apply the text normalization rules to a single column. Shared by
+        `text` and `categorical` so each column is normalized in one pass.
+        """
+        
+        if error == "coerce":
+            # Columns holding only strings and NA (e.g. already "string"
+            # dtype) are cast directly, without checking every value
+            if infer_dtype(s, skipna=True) not in ("string", "empty"):
+                str_mask = s.apply(lambda x: isinstance(x, str))
+                s = s.mask(~str_mask, pd.NA)
+            s = s.astype("string")
+        else:
+            s = s.astype("string", errors=error)
+        
+        if cleanup_re is not None:
+            s = s.str.replace(cleanup_re, "", regex=True)
+        
+        if strip is not None:
+            if strip == "both": s = s.str.strip()
+            elif strip == "left": s = s.str.lstrip()
+            elif strip == "right": s = s.str.rstrip()
+            else: raise ValueError(f"Invalid strip option: {strip}")
+        
+        if compact_whitespace is not None:
+            s = s.replace(
+                _RE_MULTI_WHITESPACE, compact_whitespace, regex=True
+            )
+        
+        if case is not None:
+            if case == "lower": s = s.str.lower()
+            elif case == "upper": s = s.str.upper()
+            elif case == "title": s = s.str.title()
+            else: raise ValueError(f"Invalid case option: {case}")
+        
+        if empty_to_na:
+            # Values are already stripped on both ends when strip="both"
+            stripped = s if strip == "both" else s.str.strip()
+            s = s.mask(stripped.eq(""), pd.NA)
+        
+        if delete_diacritics or delete_non_ascii:
+            s = self._delete_unicode(
+                s,
+                delete_diacritics=delete_diacritics,
+                delete_non_ascii=delete_non_ascii
+            )
+        
+        return s
+    
+    def _delete_unicode(
+        self,
+        s: pd.Series,
+        *,
+        delete_diacritics: bool,
+        delete_non_ascii: bool
+    ) -> pd.Series:
+        """
+        Delete diacritics and/or non-ASCII characters from a string series.
+        
+        The decomposition and regex passes are the costliest text rules, so
+        when the values repeat (names, cities, labels...) they run over the
+        distinct values only and the result is expanded back to the rows.
+        """
+        
+        # Estimate how much the values repeat from the first rows
+        sample = s.iloc[:self._DISTINCT_SAMPLE_SIZE]
+        repeats = sample.nunique() <= len(sample) // 2
+        
+        target = s
+        if repeats:
+            codes, uniques = pd.factorize(s)
+            target = pd.Series(uniques, dtype="string")
+        
+        # Combining marks are non-ASCII, so when both deletions are requested
+        # a single non-ASCII pass over the decomposed text covers them
+        if delete_diacritics and delete_non_ascii:
+            target = (
+                target.str.normalize("NFD")
+                .str.replace(_RE_NON_ASCII, "", regex=True)
+            )
+        elif delete_diacritics:
+            target = (
+                target.str.normalize("NFD")
+                .str.replace(_RE_COMBINING_MARKS, "", regex=True)
+            )
+        else:
+            target = target.str.replace(_RE_NON_ASCII, "", regex=True)
+        
+        if not repeats:
+            return target
+        
+        return pd.Series(
+            target.array.take(codes, allow_fill=True),
+            index=s.index,
+            name=s.name
+        )
+    
+    def _text_columns(
+        self,
+        columns: Sequence[str],
+        **rules: Any
+    ) -> dict[str, pd.Series]:
+        """
+        Apply the text normalization rules to a group of columns. With
+        coerced casting the values are elementwise, so the columns are
+        stacked into a single series and every rule runs once per group
+        instead of once per column.
+        """
+        
+        if rules["error"] != "coerce" or len(columns) < 2:
+            return {
+                column: self._text_series(self.data[column], **rules)
+                for column in columns
+            }
+        
+        stacked = pd.concat(
+            [self.data[column] for column in columns], ignore_index=True
+        )
+        values = self._text_series(stacked, **rules).array
+        
+        n_rows = len(self.data)
+        return {
+            column: pd.Series(
+                values[i * n_rows:(i + 1) * n_rows],
+                index=self.data.index,
+                name=column
+            )
+            for i, column in enumerate(columns)
+        }
+    
     # ----------------- API. General normalization methods ----------------- #
     def text(
         self,
@@ -253,54 +514,28 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
             f"- cleanup_pattern: {cleanup_pattern}"
         )
         
-        # Compile cleanup pattern once if provided
-        cleanup_re = (
-            re.compile(cleanup_pattern)
-            if cleanup_pattern is not None else None
-        )
+        cleanup_re = _compile_cleanup(cleanup_pattern)
         
-        for column in columns:
-            s = self.data[column]
-            
-            if error == "coerce":
-                str_mask = s.apply(lambda x: isinstance(x, str))
-                s = s.mask(~str_mask, pd.NA).astype("string")
-            else:
-                s = s.astype("string", errors=error)
-            
-            if cleanup_re is not None:
-                s = s.str.replace(cleanup_re, "", regex=True)
-            
-            if strip is not None:
-                if strip == "both": s = s.str.strip()
-                elif strip == "left": s = s.str.lstrip()
-                elif strip == "right": s = s.str.rstrip()
-                else: raise ValueError(f"Invalid strip option: {strip}")
-            
-            if compact_whitespace is not None:
-                s = s.replace(r"\s{2,}", compact_whitespace, regex=True)
-            
-            if case is not None:
-                if case == "lower": s = s.str.lower()
-                elif case == "upper": s = s.str.upper()
-                elif case == "title": s = s.str.title()
-                else: raise ValueError(f"Invalid case option: {case}")
-            
-            if empty_to_na:
-                s = s.replace(r"^\s*$", pd.NA, regex=True)
-            
-            if delete_diacritics:
-                s = (
-                    s.str.normalize("NFD")
-                    .str.replace(_RE_COMBINING_MARKS, "", regex=True)
-                )
-            
-            if delete_non_ascii:
-                s = s.str.replace(_RE_NON_ASCII, "", regex=True)
-            
-            self.data[column] = s
+        # Normalize every column first and write them back in one block
+        normalized: dict[str, pd.Series] = self._text_columns(
+            columns,
+            error=error,
+            strip=strip,
+            compact_whitespace=compact_whitespace,
+            case=case,
+            empty_to_na=empty_to_na,
+            delete_diacritics=delete_diacritics,
+            delete_non_ascii=delete_non_ascii,
+            cleanup_re=cleanup_re
+        )
+        for column in normalized:
             logger.debug(f"Succesfully normalized text column: {column}")
         
+        if normalized:
+            self.data[list(normalized)] = pd.DataFrame(
+                normalized, index=self.data.index
+            )
+        
         logger.info("Completed text normalization.")
         return self.data
     
@@ -309,7 +544,7 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
         columns: Sequence[str],
         dtype: NormalizedNumericDType = "Float64",
         errors: CastingErrorHandling = "coerce",
-        cleanup_pattern: Optional[str] = None
+        cleanup_pattern: Optional[str | re.Pattern] = None
     ) -> pd.DataFrame:
         """
         Normalizes numeric columns in the DataFrame. Useful for giving the
@@ -337,9 +572,10 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
         errors : CastingErrorHandling, optional
             Error handling strategy when converting to numeric.
         
-        cleanup_pattern : Optional[str], optional
+        cleanup_pattern : Optional[str | re.Pattern], optional
             Regular expression pattern to clean up unwanted characters
-            from the columns before conversion.
+            from the columns before conversion. An already compiled pattern
+            is used as is.
         
         Returns
         -------
@@ -353,13 +589,14 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
             f"- cleanup_pattern: {cleanup_pattern}"
         )
         
+        cleanup_re = _compile_cleanup(cleanup_pattern)
+        
+        normalized: dict[str, pd.Series] = {}
         for column in columns:
             s: pd.Series = self.data[column]
             
             # 1) Apply cleanup pattern if provided
-            if cleanup_pattern is not None:
-                cleanup_re: re.Pattern = re.compile(cleanup_pattern)
-                
+            if cleanup_re is not None:
                 try:
                     # 1.1) Apply cleanup if the column can be casted to string
                     s = s.astype("string")
@@ -377,12 +614,14 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
             # 2) Attempt conversion, if cleanup_pattern was provided, the
             # column will be string at this point (always)
             if errors != "coerce":
-                s = s.astype(dtype, errors=errors)
+                normalized[column] = s.astype(dtype, errors=errors)
                 continue
             
-            pre_na_count = int(s.isna().sum())
+            # NA telemetry is only computed when it will be emitted
+            debug = logger.isEnabledFor(logging.DEBUG)
+            pre_na_count = int(s.isna().sum()) if debug else 0
             s = pd.to_numeric(s, errors="coerce")
-            na_count = int(s.isna().sum())
+            na_count = int(s.isna().sum()) if debug else 0
             
             if na_count > pre_na_count:
                 logger.debug(
@@ -392,10 +631,15 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
                     f"{na_count})"
                 )
             
-            s = s.astype(dtype)
-            self.data[column] = s
+            normalized[column] = s.astype(dtype)
             logger.debug(f"Successfully normalized numeric column: {column}")
         
+        # 3) Write all the normalized columns back in a single assignment
+        if normalized:
+            self.data[list(normalized)] = pd.DataFrame(
+                normalized, index=self.data.index
+            )
+        
         logger.info("Completed numeric normalization.")
         return self.data
     
@@ -425,6 +669,8 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
         else:
             formats_list = list(formats)
         
+        cleanup_re = _compile_cleanup(cleanup_pattern)
+        
         for column in columns:
             # Check if already datetime
             if is_datetime64_any_dtype(self.data[column]):
@@ -444,68 +690,74 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
             
             # Convert to string for processing
             s = self.data[column].astype("string")
-            original_na_count = s.isna().sum()
             
             # Apply cleanup pattern if provided
-            if cleanup_pattern is not None:
-                cleanup_re: re.Pattern = re.compile(cleanup_pattern)
+            if cleanup_re is not None:
                 s = s.str.replace(cleanup_re, "", regex=True)
                 logger.debug(f"Applied cleanup pattern to column '{column}'")
             
-            best_series = None
-            best_na_count = len(s) + 1  # Worst case: all NAs
-            best_format = None
+            # Dates repeat a lot within a column, so every attempt parses
+            # the distinct values only and the winner is expanded back to
+            # the rows at the end
+            codes, uniques = pd.factorize(s)
+            uniques = pd.Series(uniques, dtype="string")
+            present_codes = codes[codes >= 0]
+            original_na_count = len(codes) - len(present_codes)
             
             # Try parsing without explicit format first (pandas inference)
             if not formats_list:
-                try:
-                    parsed = pd.to_datetime(
-                        s,
-                        errors='coerce',
-                        dayfirst=dayfirst,
-                        yearfirst=yearfirst,
-                        utc=utc
-                    )
-                    na_count = parsed.isna().sum()
-                    logger.debug(
-                        f"Column '{column}': inferred parsing produced "
-                        f"{na_count} NAs"
-                    )
-                    if na_count < best_na_count:
-                        best_series = parsed
-                        best_na_count = na_count
-                        best_format = "inferred"
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to parse column '{column}' with inferred "
-                        f"format: {e}"
-                    )
+                attempts = [(
+                    "inferred format",
+                    {"dayfirst": dayfirst, "yearfirst": yearfirst}
+                )]
+            else:
+                attempts = [
+                    (f"format '{fmt}'", {"format": fmt})
+                    for fmt in formats_list
+                ]
+            
+            best_parsed = None
+            best_na_count = len(s) + 1  # Worst case: all NAs
+            best_format = None
             
-            # Try each explicit format
-            for fmt in formats_list:
+            for label, parse_kwargs in attempts:
                 try:
                     parsed = pd.to_datetime(
-                        s,
-                        format=fmt,
+                        uniques,
                         errors='coerce',
-                        utc=utc
-                    )
-                    na_count = parsed.isna().sum()
-                    logger.debug(
-                        f"Column '{column}': format '{fmt}' produced "
-                        f"{na_count} NAs"
+                        utc=utc,
+                        **parse_kwargs
                     )
-                    
-                    if na_count < best_na_count:
-                        best_series = parsed
-                        best_na_count = na_count
-                        best_format = fmt
                 except Exception as e:
                     logger.warning(
-                        f"Failed to parse column '{column}' with format "
-                        f"'{fmt}': {e}"
+                        f"Failed to parse column '{column}' with {label}: {e}"
                     )
                     continue
+                
+                failed = parsed.isna().to_numpy()
+                na_count = original_na_count + int(
+                    failed[present_codes].sum()
+                )
+                logger.debug(
+                    f"Column '{column}': {label} produced {na_count} NAs"
+                )
+                
+                if na_count < best_na_count:
+                    best_parsed = parsed
+                    best_na_count = na_count
+                    best_format = parse_kwargs.get("format", "inferred")
+                
+                # No later format can beat one that adds no NAs
+                if na_count == original_na_count:
+                    break
+            
+            best_series = None
+            if best_parsed is not None:
+                best_series = pd.Series(
+                    best_parsed.array.take(codes, allow_fill=True),
+                    index=s.index,
+                    name=column
+                )
             
             # Check if we successfully parsed anything
             if best_series is None:
@@ -562,51 +814,38 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
             f"- sort_categories: {sort_categories}"
         )
         
-        # 1) Apply text normalization first using the text method
-        self.data = self.text(
-            columns=columns,
+        cleanup_re = _compile_cleanup(cleanup_pattern)
+        
+        # 1) Apply text normalization first, to the whole group at once
+        normalized: dict[str, pd.Series] = self._text_columns(
+            columns,
+            error="coerce",
             strip=strip,
             compact_whitespace=compact_whitespace,
             case=case,
             empty_to_na=empty_to_na,
             delete_diacritics=delete_diacritics,
             delete_non_ascii=delete_non_ascii,
-            cleanup_pattern=cleanup_pattern
+            cleanup_re=cleanup_re
         )
         
-        # 2) Convert each column to categorical with inferred categories
-        for column in columns:
-            s: pd.Series = self.data[column]
-            
-            # 2.1) Get unique values (categories) from the column
-            unique_values = s.dropna().unique()
-            
-            # 2.2) Sort categories if requested
-            if sort_categories:
-                try:
-                    categories = sorted(unique_values)
-                except TypeError:
-                    # If sorting fails (mixed types), keep original order
-                    logger.warning(
-                        f"Cannot sort categories for column '{column}' "
-                        f"(mixed types). Using natural order."
-                    )
-                    categories = unique_values
-            else:
-                categories = unique_values
-            
-            # 2.3) Convert to categorical dtype
-            self.data[column] = pd.Categorical(
-                s, categories=categories, ordered=ordered
+        for column, s in normalized.items():
+            # 2) Convert the column to categorical with inferred categories.
+            # A single hashing pass yields both the codes and the categories
+            # (sorted if requested), NA values get the -1 code
+            codes, categories = pd.factorize(s, sort=sort_categories)
+            self.data[column] = pd.Categorical.from_codes(
+                codes, categories=categories, ordered=ordered
             )
             
-            tmp = "(ordered)" if ordered else ""
-            has_na = self.data[column].isna().any()
-            logger.debug(
-                f"Successfully normalized categorical column '{column}' "
-                f"{tmp} with {len(categories)} categories "
-                f"(has_na: {has_na})"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                tmp = "(ordered)" if ordered else ""
+                has_na = self.data[column].isna().any()
+                logger.debug(
+                    f"Successfully normalized categorical column '{column}' "
+                    f"{tmp} with {len(categories)} categories "
+                    f"(has_na: {has_na})"
+                )
         
         logger.info("Completed categorical normalization.")
         return self.data
@@ -639,9 +878,11 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
                 s = s.replace(false_values, False)
             
             # 3) Convert to boolean dtype with coercion
-            pre_na_count = int(s.isna().sum())
+            # NA telemetry is only computed when it will be emitted
+            debug = logger.isEnabledFor(logging.DEBUG)
+            pre_na_count = int(s.isna().sum()) if debug else 0
             s = s.astype("boolean")
-            na_count = int(s.isna().sum())
+            na_count = int(s.isna().sum()) if debug else 0
             
             if na_count > pre_na_count:
                 logger.debug(
@@ -695,8 +936,9 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
             na_count: int = int(na_mask.sum())
             
             if dtype in self.CATEGORICAL_DTYPES:
-                # 3.1) Remove categories that are being converted to NA
-                current_categories = s.cat.categories.tolist()
+                # 3.1) Remove categories that are being converted to NA,
+                # membership is checked against the hashed categories Index
+                current_categories: pd.Index = s.cat.categories
                 self.data[column] = s.cat.remove_categories([
                     val for val in na_values if val in current_categories
                 ])
@@ -721,11 +963,13 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
             f"values respectively: {columns_and_fills.values()}"
         )
         
+        # 1) Validate each column and coerce its fill value to the column
+        # dtype, the filling itself is done in a single call afterwards
+        fill_map: dict[str, Any] = {}
         for column, fill_value in columns_and_fills.items():
-            s: pd.Series = self.data[column]
-            dtype = str(s.dtype)
+            dtype = str(self.data[column].dtype)
             
-            # 1) Check if the column dtype is already normalized
+            # 1.1) Check if the column dtype is already normalized
             if dtype not in self.ALL_DTYPES:
                 logger.warning(
                     f"Column '{column}' of type {dtype} is not of a "
@@ -737,96 +981,69 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
             if fill_value is None:
                 continue
             
-            # 2) Apply filling based on dtype, if not supported, use pandas
-            # default behavior
-            if dtype in self.STRING_DTYPES:
-                s = self._string_fill_na(column, fill_value)
-            elif dtype in self.NUMERIC_DTYPES:
-                fill_value = float(fill_value)
-                s = s.fillna(fill_value)
+            # 1.2) Coerce the fill value based on dtype, if not supported,
+            # use pandas default behavior
+            coerce = self._FILL_VALUE_COERCERS.get(dtype)
+            if coerce is not None:
+                fill_value = coerce(fill_value)
             elif dtype in self.CATEGORICAL_DTYPES:
-                s = self._categorical_fill_na(column, fill_value)
+                self._add_fill_category(column, fill_value)
             else:
                 logger.warning(
                     f"NA filling for dtype '{dtype}' not implemented yet. "
                     f"Using pandas default fillna behavior."
                 )
-                s = s.fillna(fill_value)
             
-            self.data[column] = s
-            logger.debug(f"Successfully filled NA values in column: {column}")
+            fill_map[column] = fill_value
         
-        logger.info("Completed filling NA values.")
-        return self.data
-    
-    def _string_fill_na(
-        self,
-        column: str,
-        fill_value: str
-    ) -> pd.Series:
-        fill_value = str(fill_value)
-        s = self.data[column]
+        if not fill_map:
+            logger.info("Completed filling NA values.")
+            return self.data
         
-        na_count = int(s.isna().sum())
-        s = s.fillna(fill_value)
-        s = s.astype("string")
+        # 2) Fill every eligible column at once
+        na_counts: Optional[pd.Series] = None
+        if logger.isEnabledFor(logging.DEBUG):
+            na_counts = self.data[list(fill_map)].isna().sum()
         
-        logger.debug(
-            f"Column '{column}': filled {na_count} NA values with "
-            f"'{fill_value}'"
-        )
-        return s
+        self.data.fillna(fill_map, inplace=True)
+        
+        if na_counts is not None:
+            for column, fill_value in fill_map.items():
+                logger.debug(
+                    f"Column '{column}': filled {int(na_counts[column])} NA "
+                    f"values with '{fill_value}'"
+                )
+        
+        logger.info("Completed filling NA values.")
+        return self.data
     
-    def _categorical_fill_na(
+    def _add_fill_category(
         self,
         column: str,
         fill_value: Any
-    ) -> pd.Series:
+    ) -> None:
         s = self.data[column]
         
-        # 1) Add fill_value to categories if not present
+        # Add fill_value to categories if not present
         if fill_value not in s.cat.categories:
-            s = s.cat.add_categories([fill_value])
+            self.data[column] = s.cat.add_categories([fill_value])
             logger.debug(
                 f"Column '{column}': added fill value '{fill_value}' to "
                 f"categories"
             )
-        
-        # 2) Fill NA values
-        na_count = int(s.isna().sum())
-        s = s.fillna(fill_value)
-        
-        logger.debug(
-            f"Column '{column}': filled {na_count} NA values with "
-            f"'{fill_value}'"
-        )
-        return s
     
     # -------------------- Specific normalization methods ------------------ #
     def text_stressed(
         self,
         columns: Sequence[str]
     ) -> pd.DataFrame:
-        return self.text(
-            columns=columns,
-            strip="both",
-            compact_whitespace=" ",
-            case="upper",
-            empty_to_na=True,
-            delete_diacritics=True,
-            delete_non_ascii=True
-        )
+        return self.text(columns=columns, **self._TEXT_STRESSED_PARAMS)
     
     def text_relaxed(
         self,
         columns: Sequence[str]
     ) -> pd.DataFrame:
-        return self.text(
-            columns=columns,
-            strip="both",
-            compact_whitespace=" ",
-            empty_to_na=True
-    )
+        return self.text(columns=columns, **self._TEXT_RELAXED_PARAMS)
     
     def numeric_float(
         self,
@@ -835,7 +1052,7 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
         return self.numeric(
             columns=columns,
             dtype="Float64",
-            cleanup_pattern=r"[$\s,%]"
+            cleanup_pattern=_RE_NUMERIC_CLEANUP
         )
     
     def numeric_int(
@@ -845,7 +1062,7 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
         return self.numeric(
             columns=columns,
             dtype="Int64",
-            cleanup_pattern=r"[$\s,%]"
+            cleanup_pattern=_RE_NUMERIC_CLEANUP
         )
     
     def date_dayfirst(
@@ -883,15 +1100,7 @@ class TabularDataNormalizer(NormalizerInterface[pd.DataFrame]):
         columns: Sequence[str]
     ) -> pd.DataFrame:
         return self.categorical(
-            columns=columns,
-            strip="both",
-            compact_whitespace=" ",
-            case="upper",
-            empty_to_na=True,
-            delete_diacritics=True,
-            delete_non_ascii=True,
-            ordered=False,
-            sort_categories=True
+            columns=columns, **self._CATEGORICAL_RELAXED_PARAMS
         )
     
     # ---------------------- Interface implementation ---------------------- #
@@ -1,7 +1,15 @@
 from __future__ import annotations
+from dataclasses import replace
+from pathlib import Path
 from string import Template
-from typing import TYPE_CHECKING, Any, Literal, Optional, Sequence
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING, Any, Iterable, Iterator, Literal, Mapping, Optional,
+    Sequence,
+)
+import hashlib
 import logging
+import time
 
 
 import awswrangler as wr
@@ -23,29 +31,199 @@ logger = logging.getLogger(__name__)
 
 
 class AthenaDataReader:
+    # UNLOAD settings used when the database details do not define any
+    DEFAULT_UNLOAD_PARAMETERS: Mapping[str, str] = MappingProxyType({
+        "file_format": "PARQUET",
+        "compression": "snappy",
+    })
+    
     def __init__(
         self,
         boto3_session: boto3.Session,
         db_details: AthenaDataBaseDetails,
+        cache_dir: Optional[Pathlike] = None,
+        cache_ttl: Optional[float] = None,
     ) -> None:
         self.session: boto3.Session = boto3_session
         self.db_details: AthenaDataBaseDetails = db_details
+        
+        # Query results are cached as Parquet files only when requested,
+        # entries older than cache_ttl seconds (if given) are re-run
+        self.cache_ttl: Optional[float] = cache_ttl
+        self.cache_dir: Optional[Path] = None
+        if cache_dir is not None:
+            self.cache_dir = Path(cache_dir)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
     
     def optimize_for(
         self, *, output_size: Literal["small", "large"]
     ) -> None:
+        """
+        Tune how query results are retrieved for the expected result size.
+        
+        Parameters
+        ----------
+        output_size : {"small", "large"}
+            "small" reads the CSV results of the query directly. "large"
+            UNLOADs the results to Snappy compressed Parquet files (unless
+            `db_details.unload_parameters` says otherwise) and reads those.
+        
+        Notes
+        -----
+        UNLOAD writes the result in parallel files, so the row order of an
+        `ORDER BY` query is not preserved when reading it back.
+        """
+        # The details are frozen (and shared between readers), so a copy
+        # with the new approach replaces them
         if output_size == "small":
-            self.db_details.ctas_approach = False
-            self.db_details.unload_approach = False
+            self.db_details = replace(
+                self.db_details, ctas_approach=False, unload_approach=False
+            )
         
         elif output_size == "large":
-            self.db_details.ctas_approach = True
-            self.db_details.unload_approach = False
+            # UNLOAD writes Parquet to S3, which is read back (and chunked)
+            # without going through the CSV results of the query
+            self.db_details = replace(
+                self.db_details, ctas_approach=False, unload_approach=True
+            )
+        
+        return None
+    
+    def _cache_path(
+        self, query: str, params: Optional[dict[str, Any]] = None
+    ) -> Optional[Path]:
+        """
+        Location of the cached result of a query, keyed by the query, its
+        parameters, the database/workgroup it runs against and the dtype
+        backend of the result.
+        """
+        if self.cache_dir is None:
+            return None
+        
+        key = hashlib.sha256(
+            "\n".join((
+                query.strip(),
+                repr(sorted((params or {}).items())),
+                str(self.db_details.database),
+                str(self.db_details.workgroup),
+                str(self.db_details.dtype_backend),
+            )).encode()
+        ).hexdigest()
+        return self.cache_dir / f"{key}.parquet"
+    
+    def _is_cache_fresh(self, cache_path: Path) -> bool:
+        """
+        Whether a cached result exists and is younger than `cache_ttl`.
+        """
+        if not cache_path.is_file():
+            return False
+        if self.cache_ttl is None:
+            return True
+        
+        age = time.time() - cache_path.stat().st_mtime
+        return age < self.cache_ttl
+    
+    def _read_cache(self, cache_path: Path) -> Optional[pd.DataFrame]:
+        """
+        Cached result of a query, None if it could not be read. An
+        unreadable (corrupt or partially written) entry is removed, so the
+        query runs again and replaces it.
+        """
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            logger.warning(
+                f"Could not read the cached result at {cache_path}, "
+                f"running the query again: {e}"
+            )
+            cache_path.unlink(missing_ok=True)
+            return None
+    
+    def _write_cache(self, cache_path: Path, df: pd.DataFrame) -> None:
+        """
+        Store a query result in the cache. A failure is only logged, the
+        result is still returned to the caller.
+        """
+        # Write next to the target first so readers never see a partially
+        # written file
+        tmp_path = cache_path.with_suffix(".tmp")
+        try:
+            df.to_parquet(tmp_path, compression="zstd")
+            tmp_path.replace(cache_path)
+        except Exception as e:
+            logger.warning(
+                f"Could not cache the query result at {cache_path}: {e}"
+            )
+        
+        return None
+    
+    def _resolve_query(self, query: Pathlike | str, **kwargs: str) -> str:
+        """
+        SQL text of a query. If `query` is a path to a file, its content is
+        read and its placeholders are filled with `kwargs`.
+        """
+        if not is_file_path(query):
+            return query
+        
+        template: Template = FileDataReader.read_sql(query)
+        if kwargs:
+            return template.substitute(**kwargs)
+        return template.template
+    
+    def _read_sql_params(self) -> dict[str, Any]:
+        """
+        Keyword arguments shared by every `wr.athena.read_sql_query` call,
+        taken from the database details.
+        """
+        details = self.db_details
+        
+        unload_parameters = details.unload_parameters
+        if unload_parameters is None and details.unload_approach:
+            unload_parameters = self.DEFAULT_UNLOAD_PARAMETERS
+        
+        return {
+            "database": details.database,
+            "ctas_approach": details.ctas_approach,
+            "ctas_parameters": (
+                dict(details.ctas_parameters)
+                if details.ctas_parameters is not None else None
+            ),
+            "unload_approach": details.unload_approach,
+            "unload_parameters": (
+                dict(unload_parameters)
+                if unload_parameters is not None else None
+            ),
+            "workgroup": details.workgroup,
+            "s3_output": details.s3_output_location,
+            "athena_cache_settings": (
+                {"max_cache_seconds": details.max_cache_seconds}
+                if details.max_cache_seconds > 0 else None
+            ),
+            # "pyarrow" parses the results straight into Arrow backed
+            # columns, faster for large results but outside of the dtypes
+            # the normalizers produce
+            "dtype_backend": details.dtype_backend,
+            "boto3_session": self.session,
+        }
+    
+    def clear_cache(self) -> None:
+        """
+        Remove every cached query result.
+        """
+        if self.cache_dir is None:
+            return None
+        
+        for path in self.cache_dir.glob("*.parquet"):
+            path.unlink(missing_ok=True)
         
         return None
     
     def execute_query(
-        self, query: Pathlike | str, **kwargs: str
+        self,
+        query: Pathlike | str,
+        *,
+        params: Optional[dict[str, Any]] = None,
+        **kwargs: str
     ) -> Optional[pd.DataFrame]:
         """
         Run the provided query at the Athena query system. All queries made
@@ -57,10 +235,26 @@ class AthenaDataReader:
             Query to run as if ran at the Athena console. If the value is a 
             valid path to a file, it will read and execute its content.
         
+        params : Optional[dict[str, Any]], optional
+            Values bound to the `:name` parameters of the query. They are
+            quoted and escaped by awswrangler, never pasted as raw SQL.
+        
         kwargs: str
             Key value pairs that specify a placeholder and its value at the
             query's placeholders (if applies).
         
+        Notes
+        -----
+        When the reader was built with a `cache_dir`, results are stored as
+        Parquet files and the same query (against the same database and
+        workgroup) is read back from disk instead of running it again, for
+        up to `cache_ttl` seconds if one was given. Use `clear_cache` when
+        the underlying tables change.
+        
+        Independently, `db_details.max_cache_seconds` lets awswrangler reuse
+        the results of an identical query Athena already ran within that
+        window, instead of executing it again.
+        
         Returns
         -------
         pd.DataFrame
@@ -77,66 +271,284 @@ class AthenaDataReader:
         code_output
         """
         
-        if is_file_path(query):
-            query: Template = FileDataReader.read_sql(query)
-            
-            if kwargs is not None:
-                query = query.substitute(**kwargs)
-            else:
-                query = query.template
+        query = self._resolve_query(query, **kwargs)
+        
+        cache_path = self._cache_path(query, params)
+        if cache_path is not None and self._is_cache_fresh(cache_path):
+            logger.debug(f"Reading cached result for query from {cache_path}")
+            cached = self._read_cache(cache_path)
+            if cached is not None:
+                return cached
         
         try:
             df: pd.DataFrame = wr.athena.read_sql_query(
-                sql=query,
-                database=self.db_details.database,
-                ctas_approach=self.db_details.ctas_approach,
-                workgroup=self.db_details.workgroup,
-                s3_output=self.db_details.s3_output_location,
-                boto3_session=self.session
+                sql=query, params=params, **self._read_sql_params()
             )
         except Exception as e:
             logger.exception(
-                f"The query provided: {query} could not be executed as an "
-                f"Athena query. Returning None."
+                "The query provided: %s could not be executed as an Athena "
+                "query. Returning None.", query
             )
             return None
         
         if df.empty:
-            logger.debug(f"The provided query got 0 rows retrieved.")
+            logger.debug("The provided query got 0 rows retrieved.")
+        
+        if cache_path is not None:
+            self._write_cache(cache_path, df)
         
         return df
     
+    def execute_queries(
+        self, queries: Sequence[Pathlike | str]
+    ) -> list[Optional[pd.DataFrame]]:
+        """
+        Run several independent queries at the Athena query system. Every
+        query is submitted before waiting on any of them, so Athena runs
+        them concurrently and the total wait is close to the slowest query
+        instead of the sum of all of them.
+        
+        Parameters
+        ----------
+        queries : Sequence[Pathlike | str]
+            Queries to run, or paths to files holding them (placeholders are
+            not filled, see `execute_query`).
+        
+        Returns
+        -------
+        list[Optional[pd.DataFrame]]
+            The result of each query, in the order given. None for the
+            queries that failed.
+        
+        Notes
+        -----
+        Results are read from the query's own output (the CTAS and UNLOAD
+        approaches are not used) and are cached like in `execute_query`.
+        """
+        
+        details = self.db_details
+        cache_settings = self._read_sql_params()["athena_cache_settings"]
+        results: list[Optional[pd.DataFrame]] = [None] * len(queries)
+        pending: list[tuple[int, str, str, Optional[Path]]] = []
+        
+        # 1) Submit every query that is not already cached. A query that can
+        #    not be read is left as None, the rest are still submitted
+        for i, query in enumerate(queries):
+            try:
+                query = self._resolve_query(query)
+            except Exception as e:
+                logger.exception(
+                    "The query provided: %s could not be read. Returning "
+                    "None for it.", query
+                )
+                continue
+            
+            cache_path = self._cache_path(query)
+            if cache_path is not None and self._is_cache_fresh(cache_path):
+                logger.debug(
+                    f"Reading cached result for query from {cache_path}"
+                )
+                results[i] = self._read_cache(cache_path)
+                if results[i] is not None:
+                    continue
+            
+            try:
+                query_id: str = wr.athena.start_query_execution(
+                    sql=query,
+                    database=details.database,
+                    s3_output=details.s3_output_location,
+                    workgroup=details.workgroup,
+                    athena_cache_settings=cache_settings,
+                    boto3_session=self.session
+                )
+            except Exception as e:
+                logger.exception(
+                    "The query provided: %s could not be submitted as an "
+                    "Athena query. Returning None for it.", query
+                )
+                continue
+            
+            pending.append((i, query, query_id, cache_path))
+        
+        # 2) Collect the results, waiting on each query in turn
+        for i, query, query_id, cache_path in pending:
+            try:
+                df: pd.DataFrame = wr.athena.get_query_results(
+                    query_execution_id=query_id,
+                    dtype_backend=details.dtype_backend,
+                    boto3_session=self.session
+                )
+            except Exception as e:
+                logger.exception(
+                    "The query provided: %s failed at Athena. Returning None "
+                    "for it.", query
+                )
+                continue
+            
+            if cache_path is not None:
+                self._write_cache(cache_path, df)
+            results[i] = df
+        
+        return results
+    
+    def execute_query_stream(
+        self,
+        query: Pathlike | str,
+        chunksize: int = 100_000,
+        *,
+        params: Optional[dict[str, Any]] = None,
+        **kwargs: str
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Run the provided query at the Athena query system and yield its
+        result in chunks, so large results never need to fit in memory at
+        once. Results are not cached.
+        
+        Parameters
+        ----------
+        query : Pathlike or str
+            Query to run, or path to a file holding it (see `execute_query`).
+        
+        chunksize : int, optional
+            Maximum number of rows per yielded DataFrame. Default is 100,000.
+        
+        params : Optional[dict[str, Any]], optional
+            Values bound to the `:name` parameters of the query.
+        
+        kwargs: str
+            Key value pairs that specify a placeholder and its value at the
+            query's placeholders (if applies).
+        
+        Yields
+        ------
+        pd.DataFrame
+            Consecutive chunks of the query result. Nothing is yielded when
+            the query fails.
+        """
+        
+        query = self._resolve_query(query, **kwargs)
+        
+        try:
+            chunks: Iterator[pd.DataFrame] = wr.athena.read_sql_query(
+                sql=query,
+                chunksize=chunksize,
+                params=params,
+                **self._read_sql_params()
+            )
+        except Exception as e:
+            logger.exception(
+                "The query provided: %s could not be executed as an Athena "
+                "query. Returning no chunks.", query
+            )
+            return
+        
+        yield from chunks
+    
     def simple_query(
         self,
         table_name: str,
-        columns: Sequence[str] | str,
+        columns: Iterable[str] | str,
         *,
         filter_by: Optional[str] = None,
-        value: Optional[str] = None
+        value: Optional[Any] = None
     ) -> pd.DataFrame:
-        if not isinstance(columns, (list, tuple, set)):
-            columns = [columns]
-        
-        query: str = f"""
-        SELECT {", ".join(columns)}
-        FROM {self.db_details.database}.{table_name}
         """
+        Select columns of a table, optionally keeping only the rows where a
+        column equals a value.
         
-        if (filter_by is not None) and (value is not None):
-            query += f" WHERE {filter_by} = {value};"
+        Parameters
+        ----------
+        table_name : str
+            Table to query, within the configured database.
+        
+        columns : Iterable[str] or str
+            Column names (or expressions) to select, or a single one.
+        
+        filter_by : Optional[str], optional
+            Column compared against `value`. The filter applies only when
+            both `filter_by` and `value` are given.
+        
+        value : Optional[Any], optional
+            Plain Python value the column must equal. It is bound as a query
+            parameter and quoted by awswrangler as a literal of its type, so
+            a string must not carry its own SQL quotes: `"abc"` is rendered
+            as `'abc'`, while `"'abc'"` is searched literally (with quotes).
+        
+        Returns
+        -------
+        pd.DataFrame
+            The selected rows, None if the query failed (see
+            `execute_query`).
+        """
+        # Any iterable of names is accepted, a single name is a string
+        cols = (columns,) if isinstance(columns, str) else tuple(columns)
         
-        query += ";"
+        # The filter value is bound as a parameter, so it gets quoted as
+        # a literal of its Python type instead of being pasted as SQL
+        has_filter = (filter_by is not None) and (value is not None)
+        where = f" WHERE {filter_by} = :value" if has_filter else ""
+        params = {"value": value} if has_filter else None
         
-        return self.execute_query(query=query)
+        query: str = (
+            f"SELECT {', '.join(cols)} "
+            f"FROM {self.db_details.database}.{table_name}{where};"
+        )
+        return self.execute_query(query=query, params=params)
     
-    def get_unique_values(self, table_name:str, column: str) -> list[Any]:
+    def get_unique_values(
+        self,
+        table_name: str,
+        column: str,
+        *,
+        limit: Optional[int] = None,
+        chunksize: Optional[int] = None
+    ) -> list[Any]:
+        """
+        Distinct values of a column of a table.
+        
+        Parameters
+        ----------
+        table_name : str
+            Table to query, within the configured database.
+        
+        column : str
+            Column (or expression) whose distinct values are retrieved.
+        
+        limit : Optional[int], optional
+            Maximum number of values to retrieve. Useful to preview high
+            cardinality columns without transferring all of their values.
+        
+        chunksize : Optional[int], optional
+            When given, the values are read in chunks of this many rows (see
+            `execute_query_stream`), so only one chunk of the result is held
+            as a DataFrame at a time. Results are not cached then.
+        
+        Returns
+        -------
+        list[Any]
+            The distinct values, empty if the query failed.
+        """
         query: str = f"""
         SELECT DISTINCT({column})
-        FROM {self.db_details.database}.{table_name};
+        FROM {self.db_details.database}.{table_name}
         """
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        
+        # The single result column is taken by position, its label may not
+        # match `column` when it is an expression or a quoted identifier
+        if chunksize is not None:
+            values: list[Any] = []
+            for chunk in self.execute_query_stream(
+                query=query + ";", chunksize=chunksize
+            ):
+                values.extend(chunk.iloc[:, 0].tolist())
+            return values
         
-        df: pd.DataFrame = self.execute_query(query=query)
-        return df[column].tolist()
+        df: Optional[pd.DataFrame] = self.execute_query(query=query + ";")
+        if df is None:
+            return []
+        return df.iloc[:, 0].tolist()
 
 
 class AWSDataReader:
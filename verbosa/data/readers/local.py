@@ -1,9 +1,15 @@
 from __future__ import annotations
+from functools import lru_cache
 from string import Template
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
+import copy
+import errno
 import json
 import logging
+import os
 import shutil
+import stat as st
 from pathlib import Path
 
 
@@ -17,11 +23,47 @@ from verbosa.utils.typings import Pathlike
 logger = logging.getLogger(__name__)
 
 
+# libyaml based loader when PyYAML was built with it, ~10x faster
+_YAML_LOADER: type = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=256)
+def _read_template(path: str, mtime_ns: int, size: int) -> Template:
+    """
+    Template with the content of a text file. Memoized by the file's
+    modification time and size, so a changed file is read again.
+    """
+    with open(path, mode="r", encoding="utf-8") as f:
+        return Template(f.read())
+
+
+@lru_cache(maxsize=128)
+def _load_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parsed content of a YAML file, memoized like `_read_template`. The
+    file is given in binary mode, the parser decodes it (UTF-8 unless a
+    BOM says otherwise) while reading its own buffered chunks.
+    """
+    with open(path, mode="rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _canonicalize(path: Path) -> Path:
+    """
+    Absolute version of `path`. `Path.resolve` makes a `readlink` call for
+    each component, so it is skipped when `path` is already absolute and
+    has no `..` components.
+    """
+    if path.is_absolute() and ".." not in path.parts:
+        return path
+    return path.resolve()
+
+
 class FileSystemNavigator:
     def __init__(self, start: Pathlike) -> None:
         self._wd: Path = Path(start)  # Working Directory
         logger.info(
-            f"TextFileDataReader initialized with start path: {self._wd}"
+            "TextFileDataReader initialized with start path: %s", self._wd
         )
     
     def cd(self, path: Pathlike) -> None:
@@ -33,13 +75,18 @@ class FileSystemNavigator:
         if not target_path.is_absolute():
             target_path = self._wd / target_path
         
-        # Resolve any symbolic links or relative components
-        target_path = target_path.resolve()
+        # Resolve any relative components
+        target_path = _canonicalize(target_path)
         
-        if not target_path.exists():
-            raise FileNotFoundError(f"Directory does not exist: {target_path}")
+        # A single stat call tells both if it exists and if it is a dir
+        try:
+            mode = os.stat(target_path).st_mode
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Directory does not exist: {target_path}"
+            ) from None
         
-        if not target_path.is_dir():
+        if not st.S_ISDIR(mode):
             raise NotADirectoryError(f"Path is not a directory: {target_path}")
         
         old_path = self._wd
@@ -58,15 +105,43 @@ class FileSystemNavigator:
         if not dest_path.is_absolute():
             dest_path = self._wd / dest_path
             
-        source_path = source_path.resolve()
+        source_path = _canonicalize(source_path)
+        
+        # Like shutil.move, moving into a directory keeps the source name
+        # and never replaces an entry already there with that name (a
+        # rename would silently replace an empty directory)
+        into_directory = dest_path.is_dir()
+        if into_directory:
+            dest_path = dest_path / source_path.name
         
-        if not source_path.exists():
-            raise FileNotFoundError(f"Source path does not exist: {source_path}")
-            
         try:
-            # Use shutil.move for cross-filesystem moves
-            moved_path = shutil.move(str(source_path), str(dest_path))
+            # (a missing source is still reported as such, see below)
+            if (
+                into_directory and os.path.exists(dest_path)
+                and os.path.lexists(source_path)
+            ):
+                raise shutil.Error(
+                    f"Destination path '{dest_path}' already exists"
+                )
+            
+            # A rename within the same filesystem, shutil.move (copy and
+            # delete) is only needed for cross-filesystem moves
+            try:
+                os.rename(source_path, dest_path)
+                moved_path = dest_path
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                moved_path = shutil.move(str(source_path), str(dest_path))
             logger.info(f"Moved {source_path} to {moved_path}")
+        except FileNotFoundError:
+            # Only checked on failure, it may be the destination's parent
+            if not source_path.exists():
+                raise FileNotFoundError(
+                    f"Source path does not exist: {source_path}"
+                ) from None
+            logger.error(f"Destination not found: {dest_path}")
+            raise
         except PermissionError as e:
             logger.error(f"Permission denied when moving {source_path} to {dest_path}")
             raise e
@@ -87,13 +162,16 @@ class FileSystemNavigator:
                 f"Current path is not a directory: {self._wd}"
             )
         
-        files_at_wd = self._wd.iterdir()
-        listing = {item.name: item for item in files_at_wd}
+        # os.scandir reads the entries in batches straight from the OS,
+        # without the per entry parsing done by Path.iterdir
+        with os.scandir(self._wd) as entries:
+            listing = {entry.name: self._wd / entry.name for entry in entries}
         
-        formatted_listing = ", ".join(listing.keys())
-        logger.debug(
-            f"Directory listing for {self._wd}: {formatted_listing}".rstrip(", ")
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            formatted_listing = ", ".join(listing.keys())
+            logger.debug(
+                f"Directory listing for {self._wd}: {formatted_listing}"
+            )
         return listing
     
     def rm(self, target: Pathlike, *, confirm: bool | None = None) -> None:
@@ -105,15 +183,25 @@ class FileSystemNavigator:
         
         target_path = Path(target)
         if not target_path.is_absolute():
-            target_path = (self._wd / target_path).resolve()
+            target_path = self._wd / target_path
+        
+        # Only the parent is resolved, resolving the whole path would
+        # follow a symbolic link at the end and remove what it links to
+        if target_path.name not in ("", ".."):
+            target_path = _canonicalize(target_path.parent) / target_path.name
         else:
-            target_path = target_path.resolve()
+            target_path = _canonicalize(target_path)
         
-        if not target_path.exists():
-            raise FileNotFoundError(f"Target does not exist: {target_path}")
+        # lstat, so a symbolic link is removed itself, not what it links to
+        try:
+            mode = os.lstat(target_path).st_mode
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Target does not exist: {target_path}"
+            ) from None
         
         try:
-            if target_path.is_dir():
+            if st.S_ISDIR(mode):
                 shutil.rmtree(target_path)
                 logger.info(f"Removed directory: {target_path}")
             else:
@@ -128,6 +216,16 @@ class FileSystemNavigator:
 
 
 class FileDataReader(FileSystemNavigator):
+    # File extension -> name of the reading method. Names instead of the
+    # methods themselves, so subclasses can override any reader
+    _READERS: Mapping[str, str] = MappingProxyType({
+        "csv": "read_csv",
+        "json": "read_json",
+        "yaml": "read_yaml",
+        "yml": "read_yaml",
+        "txt": "read_txt",
+        "sql": "read_sql",
+    })
     
     # ------------------------ Formatted data storage ------------------------
     @classmethod
@@ -141,13 +239,16 @@ class FileDataReader(FileSystemNavigator):
     
     @classmethod
     def read_yaml(cls, file_path: Pathlike) -> dict[str, Any] | list[Any]:
-        file_path = Path(file_path)
-        
-        if not file_path.exists():
-            raise FileNotFoundError(f"YAML file not found: {file_path}")
-        
-        with open(file_path, mode="r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        # Parsed once per file version, callers get their own copy since
+        # the result is mutable. The stat call also checks existence
+        path = os.path.abspath(file_path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"YAML file not found: {os.fspath(file_path)}"
+            ) from None
+        return copy.deepcopy(_load_yaml(path, stat.st_mtime_ns, stat.st_size))
     
     # --------------------------- Simple text data ---------------------------
     @classmethod
@@ -157,8 +258,11 @@ class FileDataReader(FileSystemNavigator):
     
     @classmethod
     def read_sql(cls, file_path: Pathlike) -> Template:
-        file_txt: str = FileDataReader.read_txt(file_path)
-        return Template(file_txt)
+        # Queries are usually run again and again from the same files, so
+        # the file is only read when it changed since the last call
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        return _read_template(path, stat.st_mtime_ns, stat.st_size)
     
     # ------------------------ Non-binary data storage -----------------------
     @classmethod
@@ -174,10 +278,10 @@ class FileDataReader(FileSystemNavigator):
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        suffix = file_path.suffix.lower().replace(".", "")
-        method_name = f"read_{suffix}"
+        suffix = file_path.suffix[1:].lower()
+        method_name = cls._READERS.get(suffix)
         
-        if not hasattr(cls, method_name):
+        if method_name is None:
             raise ValueError(f"Unsupported file type: .{suffix}")
         
         read_method = getattr(cls, method_name)
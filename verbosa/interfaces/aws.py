@@ -1,9 +1,14 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import ClassVar, Dict, Mapping, Optional, Sequence, Tuple
+from dataclasses import dataclass, fields
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Literal, Mapping, Optional, Sequence, Tuple
+import copy
 
 import boto3
 
+from verbosa.interfaces.column_config import _freeze
+
 
 @dataclass(frozen=True)
 class AWSCredentials:
@@ -35,6 +40,15 @@ class AWSCredentials:
         return self
     
     def to_boto3_session(self) -> boto3.Session:
+        """
+        Boto3 session for these credentials. It is built once and reused,
+        so every client created from it shares the service models and
+        credential resolution the session already loaded.
+        """
+        return self._boto3_session
+    
+    @cached_property
+    def _boto3_session(self) -> boto3.Session:
         return boto3.Session(
             aws_access_key_id=self.access_key_id,
             aws_secret_access_key=self.secret_access_key,
@@ -43,12 +57,59 @@ class AWSCredentials:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class AthenaDataBaseDetails:
+    _instances: ClassVar[Dict[Tuple, "AthenaDataBaseDetails"]] = {}
+    
     database: str
     workgroup: Optional[str] = "primary"
     s3_output_location: Optional[str] = None
     ctas_approach: bool = False
     ctas_parameters: Optional[Mapping[str, str | Sequence[str]]] = None
     unload_approach: bool = False
-    unload_parameters: Optional[Mapping[str, str | Sequence[str]]] = None
\ No newline at end of file
+    unload_parameters: Optional[Mapping[str, str | Sequence[str]]] = None
+    max_cache_seconds: int = 0
+    dtype_backend: Literal["numpy_nullable", "pyarrow"] = "numpy_nullable"
+    
+    def __new__(
+        cls,
+        database: str,
+        workgroup: Optional[str] = "primary",
+        s3_output_location: Optional[str] = None,
+        ctas_approach: bool = False,
+        ctas_parameters: Optional[Mapping[str, str | Sequence[str]]] = None,
+        unload_approach: bool = False,
+        unload_parameters: Optional[Mapping[str, str | Sequence[str]]] = None,
+        max_cache_seconds: int = 0,
+        dtype_backend: Literal["numpy_nullable", "pyarrow"] = "numpy_nullable"
+    ) -> AthenaDataBaseDetails:
+        # Same ordering as the fields, see __hash__
+        key = tuple(map(_freeze, (
+            database, workgroup, s3_output_location,
+            ctas_approach, ctas_parameters,
+            unload_approach, unload_parameters,
+            max_cache_seconds, dtype_backend,
+        )))
+        
+        # Same interning as AWSCredentials, equal details are one object
+        if key in cls._instances:
+            return cls._instances[key]
+        
+        self = super().__new__(cls)
+        cls._instances[key] = self
+        return self
+    
+    def __post_init__(self) -> None:
+        # The parameters are kept as read-only copies, so the caller's
+        # mappings can not change an instance shared under its intern key
+        for name in ("ctas_parameters", "unload_parameters"):
+            value = getattr(self, name)
+            if value is not None:
+                frozen = MappingProxyType(copy.deepcopy(dict(value)))
+                object.__setattr__(self, name, frozen)
+    
+    def __hash__(self) -> int:
+        # Mapping proxies are not hashable, their frozen contents are
+        return hash(
+            tuple(_freeze(getattr(self, f.name)) for f in fields(self))
+        )
\ No newline at end of file
@@ -1,10 +1,13 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import (
     Any, Callable, Mapping, Optional, Sequence, TypeAlias, Hashable
 )
+from weakref import WeakValueDictionary
 import re
 import logging
+import sys
 
 
 import pandas as pd
@@ -37,6 +40,21 @@ _CASTING_PATTERN: re.Pattern = (
     re.compile(r"^(?P<dtype>.+?)\('(?P<value>.+?)'\)$")
 )
 
+# dtype name in a "dtype('value')" string -> callable casting the value
+_CASTERS: dict[str, Callable[[str], StrCastedDTypes]] = {
+    "re.Pattern": re.compile,
+    "pd.Timestamp": pd.Timestamp,
+}
+
+# Sequences of parsed YAML, checked by exact type before the Sequence ABC
+_SEQUENCE_TYPES: frozenset[type] = frozenset({list, tuple})
+
+# Leaf types of parsed YAML (and of the values `_cast_string` produces),
+# returned as they are by `_freeze`/`_unfreeze`
+_SCALAR_TYPES: frozenset[type] = frozenset(
+    {str, int, float, bool, bytes, type(None), re.Pattern, pd.Timestamp}
+)
+
 
 def _cast_string(value: Any) -> StrCastedDTypes | Any:
     """
@@ -66,17 +84,38 @@ def _cast_string(value: Any) -> StrCastedDTypes | Any:
     
     if not isinstance(value, str):
         return value
+    return _cast_string_cached(value)
+
+
+@lru_cache(maxsize=1024)
+def _cast_string_cached(value: str) -> StrCastedDTypes | str:
+    """
+    `_cast_string` for strings. Configs repeat the same na values and
+    parameters across columns, and both cast types are immutable, so the
+    result is memoized.
+    """
+    # Strings that can not match the pattern skip the regex engine
+    if "('" not in value or not value.endswith("')"):
+        return value
     
     match = _CASTING_PATTERN.fullmatch(value)
     if match is None: return value
     
-    dtype_str = match.group("dtype").strip()
-    cast_value = match.group("value").strip()
+    caster = _CASTERS.get(match.group("dtype").strip())
+    if caster is None: return value
     
-    if dtype_str == "re.Pattern": return re.compile(cast_value)
-    elif dtype_str == "pd.Timestamp": return pd.Timestamp(cast_value)
-    
-    return value
+    return caster(match.group("value").strip())
+
+
+# Live CallSpec instances built by `CallSpec.from_map`, by their content
+_INTERNED_SPECS: WeakValueDictionary[tuple, CallSpec] = WeakValueDictionary()
+
+
+def _sort_by_key(item: tuple[str, Any]) -> str:
+    """
+    Default order of `CallSpec.params`, by parameter name.
+    """
+    return item[0]
 
 
 def _freeze(value: Any) -> Hashable:
@@ -105,8 +144,14 @@ def _freeze(value: Any) -> Hashable:
         A hashable equivalent of the input value following the rules above.
     """
     
-    # Handle mappings (dict-like)
-    if isinstance(value, Mapping):
+    # Most values are scalars, checked by exact type before the (slower)
+    # isinstance checks against the Mapping ABC
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES:
+        return value
+    
+    # Handle mappings (dict-like), YAML only gives plain dicts
+    if value_type is dict or isinstance(value, Mapping):
         # Freeze keys+values and sort for determinism
         return tuple(
             sorted((k, _freeze(v)) for k, v in value.items())
@@ -138,6 +183,9 @@ def _unfreeze(value: Any) -> Any:
     - frozenset -> set
     - everything else -> unchanged
     """
+    if type(value) in _SCALAR_TYPES:
+        return value
+    
     # Frozen mapping: tuple of (key, value) pairs
     if isinstance(value, tuple):
         if value and all(
@@ -153,7 +201,7 @@ def _unfreeze(value: Any) -> Any:
     return value
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True)
 class CallSpec:
     """
     A hashable "method call" including the name of the method and its
@@ -176,9 +224,35 @@ class CallSpec:
     as "re.Pattern('...')" or "pd.Timestamp('...')".
     """
     
+    # `_hash` and `_hash_str` hold the hash and to_hash string, computed
+    # on first use (specs are keys of the grouping dicts, so they get
+    # hashed once per column and step). Declared as slots, not fields, so
+    # dataclasses.fields/asdict/astuple only see the spec itself
+    __slots__ = (
+        "method_name", "params", "_hash", "_hash_str", "__weakref__",
+    )
+    
     method_name: TDNormalizationMethod | TDReviewMethod
     params: tuple[tuple[str, Any], ...]
     
+    # ------------------------ Dunder Methods ------------------------------ #
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash((self.method_name, self.params))
+            object.__setattr__(self, "_hash", value)
+            return value
+    
+    def __getstate__(self) -> tuple[Any, ...]:
+        # The cached values are left out, string hashes change between
+        # interpreter runs so a pickled `_hash` would be stale
+        return (self.method_name, self.params)
+    
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        object.__setattr__(self, "method_name", state[0])
+        object.__setattr__(self, "params", state[1])
+    
     # ------------------------ Class Methods ------------------------------- #
     @classmethod
     def from_map(
@@ -188,49 +262,89 @@ class CallSpec:
         *,
         sort_key: Callable[[tuple[str, Any]], Any] | None = None
     ) -> "CallSpec":
-        sort_key = sort_key or (lambda kv: kv[0]) 
+        sort_key = sort_key or _sort_by_key
+        
+        # Method names and parameter keys repeat across every column of a
+        # config, interned they compare by identity when specs are keyed
+        if isinstance(method_name, str):
+            method_name = sys.intern(method_name)
+        
         if parameters is None:
             logger.debug(
-                f"CallSpec parameters for method '{method_name}' is None. "
-                "Using empty parameters."
+                "CallSpec parameters for method '%s' is None. "
+                "Using empty parameters.",
+                method_name,
             )
-            return cls(method_name=method_name, params=tuple())
+            return cls._interned(method_name, tuple())
         
-        if not isinstance(parameters, Mapping):
+        if type(parameters) is not dict and not isinstance(
+            parameters, Mapping
+        ):
             logger.debug(
                 "CallSpec parameters must be a mapping (dict-like). "
-                f"Got {type(parameters).__name__}."
+                "Got %s.",
+                type(parameters).__name__,
             )
-            return cls(method_name=method_name, params=tuple())
+            return cls._interned(method_name, tuple())
         
         keys_and_values: list[tuple[str, Any]] = []
         for k, v in parameters.items():
+            k = sys.intern(k) if isinstance(k, str) else k
             v = _cast_string(v)
             v = _freeze(v)
             keys_and_values.append((k, v))
         
-        return cls(
-            method_name=method_name,
-            params=tuple(sorted(keys_and_values, key=sort_key))
+        return cls._interned(
+            method_name, tuple(sorted(keys_and_values, key=sort_key))
         )
     
+    @classmethod
+    def _interned(
+        cls,
+        method_name: TDNormalizationMethod | TDReviewMethod,
+        params: tuple[tuple[str, Any], ...]
+    ) -> "CallSpec":
+        """
+        The live instance for this method call, created if there is none.
+        Columns sharing a step then share one (already hashed) spec.
+        """
+        # The repr tells apart values that compare equal, like 1 and True
+        try:
+            key = (method_name, params, repr(params))
+            spec = _INTERNED_SPECS.get(key)
+        except TypeError:  # Unhashable params, nothing to share
+            return cls(method_name=method_name, params=params)
+        
+        if spec is None:
+            spec = cls(method_name=method_name, params=params)
+            _INTERNED_SPECS[key] = spec
+        return spec
+    
     # ------------------------ Instance Methods ---------------------------- #
     def params_to_dict(self) -> dict[str, Any]:
         return {k: _unfreeze(v) for k, v in self.params}
     
     def to_hash(self) -> str:
         """Deterministic human-readable hash used for logs / grouping."""
+        try:
+            return self._hash_str
+        except AttributeError:
+            pass
+        
         if not self.params:
-            return f"{self.method_name}"
-        hashed_params = " - ".join(str(item) for item in self.params)
-        return f"{self.method_name}: {hashed_params}"
+            value = f"{self.method_name}"
+        else:
+            hashed_params = " - ".join(map(str, self.params))
+            value = f"{self.method_name}: {hashed_params}"
+        object.__setattr__(self, "_hash_str", value)
+        return value
     
     def has_parameters(self) -> bool:
         """Check if this CallSpec has any parameters."""
         return (isinstance(self.params, tuple) and len(self.params) > 0)
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnConfig:
     """
     Stores data related to a column.
@@ -275,11 +389,15 @@ class ColumnConfig:
     normalization: Optional[NormalizationSpecInput] = None
     
     def __post_init__(self) -> None:
-        # 1) Ensure aliases is a set and includes the main name
+        # 1) Ensure aliases is a set and includes the main name. YAML gives
+        #    lists, matched by exact type before the slower ABC check
         aliases: set[str] = set()
-        if isinstance(self.aliases, str):
+        aliases_type = type(self.aliases)
+        if aliases_type is str:
             aliases.add(self.aliases)
-        elif isinstance(self.aliases, Sequence):
+        elif aliases_type in _SEQUENCE_TYPES or isinstance(
+            self.aliases, Sequence
+        ):
             aliases = set(self.aliases)
         elif self.aliases is None:
             aliases = set()
@@ -290,20 +408,23 @@ class ColumnConfig:
             )
             aliases = set()
         
-        self.aliases: set[str] = aliases
-        self.aliases.add(self.name)
+        # Never modified after this point
+        aliases.add(self.name)
+        self.aliases: frozenset[str] = frozenset(aliases)
         
         # 2) Cast every na value to its correct dtype
         na_values: Optional[tuple[StrCastedDTypes | str]] = None
-        self.na_values = (
-            [self.na_values]
-            if isinstance(self.na_values, str)
-            else self.na_values
-        )
-        if isinstance(self.na_values, Sequence):
-            na_values = tuple(_cast_string(nas) for nas in self.na_values)
-        elif self.na_values is not None:
-            na_values = (_cast_string(self.na_values), )
+        raw_na_values = self.na_values
+        if raw_na_values is None:
+            pass
+        elif isinstance(raw_na_values, str):
+            na_values = (_cast_string(raw_na_values), )
+        elif type(raw_na_values) in _SEQUENCE_TYPES or isinstance(
+            raw_na_values, Sequence
+        ):
+            na_values = tuple(map(_cast_string, raw_na_values))
+        else:
+            na_values = (_cast_string(raw_na_values), )
         
         self.na_values: Optional[tuple[StrCastedDTypes | str]] = na_values
         
@@ -332,7 +453,14 @@ class ColumnConfig:
         if value is None:
             return None
         
-        # Already normalized
+        # Already normalized, exact types are checked before the slower
+        # isinstance fallback below. Every item is checked, so a stray
+        # non-spec still gets rejected here
+        if type(value) is tuple and all(
+            type(x) is CallSpec for x in value
+        ):
+            return value
+        
         is_callspec_tuple = (
             isinstance(value, tuple) and
             all(isinstance(x, CallSpec) for x in value)
@@ -345,7 +473,7 @@ class ColumnConfig:
             return (CallSpec.from_map(value, None),)
         
         # Legacy dict-of-dict
-        if isinstance(value, Mapping):
+        if type(value) is dict or isinstance(value, Mapping):
             specs: list[CallSpec] = []
             for method, params in value.items():
                 spec = CallSpec.from_map(method, params)
@@ -408,7 +536,7 @@ class ColumnConfig:
             "name": self.name,
             "dtype": self.dtype,
             "description": self.description,
-            "aliases": tuple(self.aliases),
+            "aliases": tuple(sorted(self.aliases)),
             "na_values": self.na_values,
             "fill_na": self.fill_na,
             "reviews": self._pipeline_to_yaml(self.reviews),
@@ -438,8 +566,9 @@ class ColumnConfig:
             return ("None",)
         
         # If a custom sort_key is provided, we re-order each spec's params
-        # for hashing. (Normally params are already stored sorted.)
-        if sort_key is None:
+        # for hashing. (Normally params are already stored sorted by key,
+        # so the cached `to_hash` of each spec is used as is.)
+        if sort_key is None or sort_key is _sort_by_key:
             return tuple(spec.to_hash() for spec in pipeline)
         
         rehashed: list[str] = []
@@ -448,7 +577,7 @@ class ColumnConfig:
                 rehashed.append(f"{spec.method_name}")
                 continue
             hashed_params = " - ".join(
-                str(item) for item in sorted(spec.params, key=sort_key)
+                map(str, sorted(spec.params, key=sort_key))
             )
             rehashed.append(f"{spec.method_name}: {hashed_params}")
         
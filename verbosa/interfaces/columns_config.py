@@ -1,6 +1,7 @@
 from __future__ import annotations
-from collections import OrderedDict
+from collections import Counter
 from collections.abc import Mapping
+from operator import attrgetter
 from typing import Any, Iterator, Optional, Sequence
 import logging
 
@@ -15,6 +16,11 @@ from verbosa.data.readers.local import FileDataReader
 logger = logging.getLogger(__name__)
 
 
+# (name, value) pairs of a column, fed straight into dict()
+_NAME_AND_NA_VALUES = attrgetter("name", "na_values")
+_NAME_AND_FILL_NA = attrgetter("name", "fill_na")
+
+
 class ColumnsConfig(Mapping[str, ColumnConfig]):
     """
     A representation of the data found at a columns configuration file.
@@ -39,6 +45,11 @@ class ColumnsConfig(Mapping[str, ColumnConfig]):
         List of column configurations
     """
     
+    __slots__ = (
+        "name", "description", "author", "date", "_columns", "columns",
+        "_index", "_alias_conflicts",
+    )
+    
     def __init__(
         self,
         name: str,
@@ -51,8 +62,11 @@ class ColumnsConfig(Mapping[str, ColumnConfig]):
         self.description: str = description
         self.author: str = author
         self.date: str = date
-        self._columns = tuple(columns)
-        self.columns: tuple[str] = tuple(col.name for col in self._columns)
+        # tuple() of a tuple (as built by from_dict) is the same object
+        self._columns: tuple[ColumnConfig, ...] = tuple(columns)
+        self.columns: tuple[str, ...] = tuple(
+            col.name for col in self._columns
+        )
         self._build_index()
     
     def _build_index(self) -> None:
@@ -60,16 +74,23 @@ class ColumnsConfig(Mapping[str, ColumnConfig]):
         Build index for column lookup by name/alias.
         """
         self._index: dict[str, ColumnConfig] = {}
+        self._alias_conflicts: list[tuple[str, str]] = []
         
+        # The first column claiming an alias keeps it. The index only grows
+        # when the alias was free, so a single lookup inserts and detects
+        # conflicts, kept for `validate_aliases`
+        index = self._index
         for col in self._columns:
             for alias in col.aliases:
-                if alias not in self._index:
-                    self._index[alias] = col
+                n_indexed = len(index)
+                index.setdefault(alias, col)
+                if len(index) > n_indexed:
                     continue
                 
+                self._alias_conflicts.append((alias, col.name))
                 logger.debug(
-                    f"Conflict while indexing alias {alias} for column "
-                    f"{col.name}",
+                    "Conflict while indexing alias %s for column %s",
+                    alias, col.name,
                 )
             
             # (self._index[col.name] is self._index[alias]) == True
@@ -77,7 +98,7 @@ class ColumnsConfig(Mapping[str, ColumnConfig]):
     # ------------------------- Dunder Methods ----------------------------- #
     def __getitem__(self, key: str) -> ColumnConfig:
         """
-        Mapping access by name or alias (case-insensitive).
+        Mapping access by name or alias (exact match, case-sensitive).
         
         Raises
         ------
@@ -96,7 +117,7 @@ class ColumnsConfig(Mapping[str, ColumnConfig]):
         """
         Iterate over primary column names in their original order.
         """
-        for col in self._columns: yield col.name
+        return iter(self.columns)
     
     def __len__(self) -> int:
         """
@@ -106,7 +127,7 @@ class ColumnsConfig(Mapping[str, ColumnConfig]):
     
     def __contains__(self, key: str) -> bool:
         """
-        Membership by name or alias, case-insensitive.
+        Membership by name or alias, exact match (case-sensitive).
         """
         
         return key in self._index
@@ -203,38 +224,24 @@ class ColumnsConfig(Mapping[str, ColumnConfig]):
         """
         issues = []
         
-        seen_names: dict[str, list[str]] = {}
-        for col in self._columns:
-            seen_names.setdefault(col.name, []).append(col.name)
-        
-        duplicate_names = {
-            column_name: aliases
-            for column_name, aliases in seen_names.items()
-            if len(aliases) > 1
-        }
+        # 1) Duplicate column names, only their counts are needed
+        name_counts = Counter(col.name for col in self._columns)
+        duplicate_names = [
+            name for name, count in name_counts.items() if count > 1
+        ]
         if duplicate_names:
-            formatted = ", ".join(
-                f"{'/'.join(sorted(set(names)))}"
-                for names in duplicate_names.values()
-            )
+            formatted = ", ".join(duplicate_names)
             issues.append(
-                f"Duplicate column names (case-insensitive): {formatted}"
+                f"Duplicate column names (case-sensitive): {formatted}"
             )
         
-        # 2) Overlapping names/aliases between columns (case-sensitive)
-        #    We track where each normalized identifier came from.
-        used: set = set()
-        for col in self._columns:
-            # Aliases
-            for alias in col.aliases:
-                if alias not in used:
-                    used.add(alias)
-                    continue
-                
-                issues.append(
-                    f"Alias '{alias}' in column '{col.name}' "
-                    "overlaps with another column"
-                )
+        # 2) Overlapping names/aliases between columns (case-sensitive),
+        #    already found while building the index
+        for alias, column_name in self._alias_conflicts:
+            issues.append(
+                f"Alias '{alias}' in column '{column_name}' "
+                "overlaps with another column"
+            )
         
         return issues
     
@@ -268,16 +275,21 @@ class ColumnsConfig(Mapping[str, ColumnConfig]):
         - If you need *pipeline* grouping (columns sharing the same full
         pipeline), use `group_by_normalization_pipeline`.
         """
-        groups: OrderedDict[CallSpec, list[str]] = OrderedDict()
+        # Plain dicts keep insertion order, so groups follow column order
+        groups: dict[CallSpec, list[str]] = {}
         
         for col in self._columns:
             pipeline = col.normalization
             if pipeline is None:
                 continue
             for spec in pipeline:
-                groups.setdefault(spec, []).append(col.name)
+                names = groups.get(spec)
+                if names is None:
+                    groups[spec] = [col.name]
+                else:
+                    names.append(col.name)
         
-        return tuple((spec, tuple(cols)) for spec, cols in groups.items())
+        return tuple(zip(groups.keys(), map(tuple, groups.values())))
     
     def group_by_normalization_pipeline(
         self,
@@ -290,15 +302,17 @@ class ColumnsConfig(Mapping[str, ColumnConfig]):
         tuple[tuple[tuple[CallSpec, ...], tuple[str, ...]], ...]
             Each entry is a pair: (pipeline, (column_names...)).
         """
-        groups: OrderedDict[tuple[CallSpec, ...], list[str]] = OrderedDict()
+        groups: dict[tuple[CallSpec, ...], list[str]] = {}
         
         for col in self._columns:
             pipeline = col.normalization or ()
-            groups.setdefault(pipeline, []).append(col.name)
+            names = groups.get(pipeline)
+            if names is None:
+                groups[pipeline] = [col.name]
+            else:
+                names.append(col.name)
         
-        return tuple(
-            (pipeline, tuple(cols)) for pipeline, cols in groups.items()
-        )
+        return tuple(zip(groups.keys(), map(tuple, groups.values())))
     
     def get_na_values_dict(
         self
@@ -311,10 +325,7 @@ class ColumnsConfig(Mapping[str, ColumnConfig]):
         dict[str, Optional[tuple[AllowedCastingDTypes]]]
             Mapping of column names to their na_values tuples.
         """
-        result: dict[str, Optional[tuple[StrCastedDTypes | str]]] = {}
-        for col in self._columns:
-            result[col.name] = col.na_values
-        return result
+        return dict(map(_NAME_AND_NA_VALUES, self._columns))
     
     def get_columns_fill_na_dict(
         self
@@ -327,7 +338,4 @@ class ColumnsConfig(Mapping[str, ColumnConfig]):
         dict[str, Optional[AllowedCastingDTypes]]
             Mapping of column names to their fill_na values.
         """
-        result: dict[str, Optional[StrCastedDTypes | str]] = {}
-        for col in self._columns:
-            result[col.name] = col.fill_na
-        return result
\ No newline at end of file
+        return dict(map(_NAME_AND_FILL_NA, self._columns))
\ No newline at end of file
@@ -12,26 +12,31 @@ from verbosa.data.readers.local import FileDataReader
 LogLevels = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
 
-class ConfigPathDescriptor:
-    def __set_name__(self, owner: type[LogsMachine], name: str) -> None:
-        self.name = name
-    
-    def __get__(self, instance, owner):
-        return instance.__dict__[self.name]
-    
-    def __set__(self, instance, value: Pathlike) -> None:
-        config_dict_attr = "config_dict"
-        instance.__dict__[config_dict_attr] = FileDataReader.read_file(value)
-        instance.__dict__[self.name] = value
-
-
 class LogsMachine:
-    config_path: Pathlike = ConfigPathDescriptor()
+    __slots__ = ("_config_path", "_config_dict")
     
     def __init__(self, config_path: Pathlike) -> None:
-        self.config_dict: dict = dict()
         self.config_path: Pathlike = config_path
     
+    @property
+    def config_path(self) -> Pathlike:
+        return self._config_path
+    
+    @config_path.setter
+    def config_path(self, value: Pathlike) -> None:
+        # The file is read on first use of `config_dict`, not here
+        self._config_path = value
+        self._config_dict: Optional[dict] = None
+    
+    @property
+    def config_dict(self) -> dict:
+        """
+        Logging configuration read from `config_path`, read once.
+        """
+        if self._config_dict is None:
+            self._config_dict = FileDataReader.read_file(self._config_path)
+        return self._config_dict
+    
     def on(self) -> None:
         logging.config.dictConfig(self.config_dict)
         logger = logging.getLogger(__name__)
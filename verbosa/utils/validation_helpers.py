@@ -3,11 +3,29 @@ from pathlib import Path
 from typing import Optional
 
 
+# Longest path accepted by common filesystems (Linux PATH_MAX)
+_MAX_PATH_LENGTH: int = 4096
+
+
 def is_file_path(path: str, extension: Optional[str] = None) -> bool:
-    """Check if the given path is a valid file path."""
-    is_file = Path(path).is_file()
+    """
+    Check if the given path is a valid file path.
+    
+    Strings that cannot be a path (e.g. multi-line or very long inline SQL)
+    are rejected without touching the filesystem, and names the OS refuses
+    to look up (too long, null bytes) are not a file either.
+    """
+    if isinstance(path, str) and (
+        "\n" in path or len(path) > _MAX_PATH_LENGTH
+    ):
+        return False
+    
+    try:
+        is_file = Path(path).is_file()
+    except (OSError, ValueError):
+        return False
     
     extension = extension.lstrip(".") if extension else None
     if extension:
-        return is_file and Path(path).suffix == extension
+        return is_file and Path(path).suffix == f".{extension}"
     return is_file
\ No newline at end of file
@@ -3,10 +3,11 @@ Selection widget for filtering a dataframe
 """
 
 from __future__ import annotations
-from typing import Any, Sequence
+from typing import Any, Literal, Optional, Sequence
 import logging
 
 
+import numpy as np
 import pandas as pd
 
 
@@ -22,6 +23,31 @@ class SelectionMenu:
     def __init__(self, data: pd.DataFrame):
         self.data = data
     
+    def _string_column(
+        self,
+        column: str,
+        case: Optional[Literal["upper", "lower"]] = None
+    ) -> Optional[pd.Series]:
+        """
+        String version of a column (upper or lower cased if `case` says
+        so), None if it can not be casted. For categorical columns only
+        their categories are casted, see `search`.
+        """
+        # Cased with python's str methods, as pandas' case=False does
+        s: Optional[pd.Series] = self.data[column]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            s = pd.Series(s.cat.categories)
+        
+        try:
+            if str(s.dtype) != "string":
+                s = s.astype("string")
+            if case is not None:
+                s = s.str.upper() if case == "upper" else s.str.lower()
+        except Exception as e:
+            s = None
+        
+        return s
+    
     def search(
         self,
         value: Any,
@@ -64,46 +90,54 @@ class SelectionMenu:
         if not isinstance(value, str):
             value: str = str(value)
         
-        columns: list[str] = list(at)
-        if at != "all" and isinstance(at, str):
-            columns = [at]
+        columns: list[str]
+        if isinstance(at, str):
+            columns = self.data.columns.tolist() if at == "all" else [at]
+        else:
+            columns = list(at)
         
-        if at == "all":
-            columns = self.data.columns.tolist()
+        # 2) String version of each search column, built from the current
+        #    data on every search. They are not written back, so
+        #    `self.data` keeps its dtypes. Case insensitive searches fold
+        #    both sides (upper, as str.contains(case=False) does; lower
+        #    for whole matches)
+        case: Optional[Literal["upper", "lower"]] = None
+        if not case_sensitive:
+            case = "lower" if whole_match else "upper"
+            value = value.lower() if whole_match else value.upper()
         
-        # 2) Cast all search columns to string
-        for column in columns.copy():
+        # Categorical columns are matched once per category, the codes
+        # spread those matches over the rows
+        strings: list[tuple[pd.Series, Optional[np.ndarray]]] = []
+        for column in columns:
             if column not in self.data.columns:
-                columns.remove(column)
                 continue
             
-            try:
-                s = self.data[column].astype("string")
-            except Exception as e:
-                columns.remove(column)
+            s = self._string_column(column, case)
+            if s is None:
                 continue
             
-            self.data[column] = s
-        
-        # 3) Get a boolean mask composed of each column match evaluation
-        matches_mask: pd.Series = pd.Series(False, index=self.data.index)
+            codes: Optional[np.ndarray] = None
+            if isinstance(self.data[column].dtype, pd.CategoricalDtype):
+                codes = self.data[column].cat.codes.to_numpy()
+            strings.append((s, codes))
         
-        if not whole_match:
-            for column in columns:
-                s = self.data[column]
-                matches_mask = (
-                    matches_mask |
-                    s.str.contains(value, case=case_sensitive, regex=False)
-                )
-            
-            return self.data.loc[matches_mask, :]
+        # 3) A boolean mask composed of each column match evaluation,
+        #    accumulated in place on a single numpy array
+        #    (the kind of match is picked once, not per column)
+        if whole_match:
+            def is_match(s: pd.Series) -> pd.Series:
+                return s.eq(value)
+        else:
+            def is_match(s: pd.Series) -> pd.Series:
+                return s.str.contains(value, regex=False, na=False)
         
-        for column in columns:
-            s = self.data[column]
-            if case_sensitive:
-                s = s.str.lower()
-                value = value.lower()
-            
-            matches_mask = matches_mask | s.eq(value)
+        matches_mask = np.zeros(len(self.data), dtype=bool)
+        for s, codes in strings:
+            matches = is_match(s).to_numpy(dtype=bool, na_value=False)
+            if codes is not None:
+                # A trailing False for the -1 code of missing values
+                matches = np.append(matches, False)[codes]
+            matches_mask |= matches
         
-        return self.data.loc[matches_mask, :]
\ No newline at end of file
+        return self.data.take(np.flatnonzero(matches_mask))
\ No newline at end of file